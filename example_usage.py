@@ -20,45 +20,69 @@ from plugin_metadata_reader import (
     PluginType
 )
 
+# Use orjson for faster JSON export if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import Windows-specific DLL reader if on Windows
 if sys.platform == 'win32':
     from dll_reader import VST2DllReader, scan_vst_dlls
 
 
+# Shared scanner, created on first use
+_SCANNER: Optional[PluginScanner] = None
+
+
+def get_scanner() -> PluginScanner:
+    """Get the shared PluginScanner, creating it on first use"""
+    global _SCANNER
+    if _SCANNER is None:
+        _SCANNER = PluginScanner()
+    return _SCANNER
+
+
 def print_plugin_info(metadata: PluginMetadata, verbose: bool = False):
     """Pretty print plugin metadata"""
-    print(f"\n{'='*60}")
-    print(f"Plugin: {metadata.name}")
-    print(f"Format: {metadata.format.value}")
-    print(f"Path: {metadata.path}")
+    # Build the whole block first and write it in one call
+    lines = [
+        f"\n{'='*60}",
+        f"Plugin: {metadata.name}",
+        f"Format: {metadata.format.value}",
+        f"Path: {metadata.path}",
+    ]
     
     if metadata.version:
-        print(f"Version: {metadata.version}")
+        lines.append(f"Version: {metadata.version}")
     if metadata.manufacturer:
-        print(f"Manufacturer: {metadata.manufacturer}")
+        lines.append(f"Manufacturer: {metadata.manufacturer}")
     if metadata.plugin_type:
-        print(f"Type: {metadata.plugin_type.value}")
+        lines.append(f"Type: {metadata.plugin_type.value}")
     if metadata.category:
-        print(f"Category: {metadata.category}")
+        lines.append(f"Category: {metadata.category}")
     
     if verbose:
         if metadata.description:
-            print(f"Description: {metadata.description}")
+            lines.append(f"Description: {metadata.description}")
         if metadata.unique_id:
-            print(f"Unique ID: {metadata.unique_id}")
+            lines.append(f"Unique ID: {metadata.unique_id}")
         if metadata.bundle_id:
-            print(f"Bundle ID: {metadata.bundle_id}")
+            lines.append(f"Bundle ID: {metadata.bundle_id}")
         if metadata.is_64bit is not None:
-            print(f"64-bit: {metadata.is_64bit}")
+            lines.append(f"64-bit: {metadata.is_64bit}")
         if metadata.supported_architectures:
-            print(f"Architectures: {', '.join(metadata.supported_architectures)}")
+            lines.append(f"Architectures: {', '.join(metadata.supported_architectures)}")
         if metadata.additional_info:
-            print(f"Additional Info: {json.dumps(metadata.additional_info, indent=2)}")
+            lines.append(f"Additional Info: {json.dumps(metadata.additional_info, indent=2)}")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def scan_single_plugin(path: str, verbose: bool = False):
     """Scan a single plugin file or bundle"""
-    scanner = PluginScanner()
+    scanner = get_scanner()
     
     print(f"Scanning plugin: {path}")
     metadata = scanner.read_plugin(path)
@@ -73,7 +97,7 @@ def scan_single_plugin(path: str, verbose: bool = False):
 
 def scan_directory(directory: str, format_filter: Optional[str] = None, verbose: bool = False):
     """Scan a directory for plugins"""
-    scanner = PluginScanner()
+    scanner = get_scanner()
     
     # Convert format string to enum if provided
     plugin_format = None
@@ -101,7 +125,7 @@ def scan_directory(directory: str, format_filter: Optional[str] = None, verbose:
 
 def scan_default_locations(verbose: bool = False):
     """Scan all default plugin locations on the system"""
-    scanner = PluginScanner()
+    scanner = get_scanner()
     
     print("Scanning default plugin locations...")
     print(f"Operating System: {sys.platform}")
@@ -144,8 +168,11 @@ def export_to_json(plugins: List[PluginMetadata], output_file: str):
     """Export plugin metadata to JSON file"""
     data = [plugin.to_dict() for plugin in plugins]
     
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    if HAS_ORJSON:
+        Path(output_file).write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
     
     print(f"\nExported {len(plugins)} plugin(s) to: {output_file}")
 
@@ -166,16 +193,14 @@ def export_to_csv(plugins: List[PluginMetadata], output_file: str):
     ]
     
     with open(output_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
         
-        for plugin in plugins:
-            row = plugin.to_dict()
-            # Flatten nested values
-            for key in fieldnames:
-                if key not in row:
-                    row[key] = ''
-            writer.writerow(row)
+        # One row per plugin, limited to the CSV columns
+        writer.writerows(
+            tuple(row.get(key, '') for key in fieldnames)
+            for row in (plugin.to_dict() for plugin in plugins)
+        )
     
     print(f"\nExported {len(plugins)} plugin(s) to: {output_file}")
 
@@ -248,7 +273,7 @@ def main():
     elif args.action == 'test':
         # Run test scan with sample paths
         print("Running test scan...")
-        scanner = PluginScanner()
+        scanner = get_scanner()
         
         # Test with some common plugin paths
         test_paths = []
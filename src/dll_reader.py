@@ -3,16 +3,99 @@ Windows DLL Reader for VST2 Plugins
 Provides functionality to read metadata from Windows DLL files for VST2 plugins.
 """
 
+import mmap
+import re
 import struct
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from metadata_cache import MetadataCache
+except ImportError:
+    from .metadata_cache import MetadataCache
+
+
+# Precompiled layouts for PE structures
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_U16_PAIR = struct.Struct('<HH')
+_U32_PAIR = struct.Struct('<II')
+_PE_HEADER = struct.Struct('<4sHHIIIHH')     # Signature + COFF file header
+_SECTION_HEADER = struct.Struct('<8sIIII')   # Name, sizes and offsets
+_SECTION_HEADER_SIZE = 40
+_VERSION_BLOCK = struct.Struct('<HHH')       # wLength, wValueLength, wType
+
+
+def map_file(f) -> mmap.mmap:
+    """Map an open binary file read-only, hinting sequential access where supported"""
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+
+def find_first(pattern: re.Pattern, data, count: int, start: int = 0) -> Dict[bytes, int]:
+    """
+    Map each literal matched by an alternation pattern to its first offset
+    
+    The buffer is scanned once from `start`; scanning stops early when all
+    `count` literals have been seen.
+    """
+    found = {}
+    for match in pattern.finditer(data, start):
+        found.setdefault(match.group(), match.start())
+        if len(found) == count:
+            break
+    return found
+
+
+def find_utf16_end(data, start: int, end: int) -> int:
+    """Offset of the UTF-16 NUL terminator of a string at start, or end if there is none"""
+    nul = data.find(b'\x00\x00', start, end)
+    # Only a terminator on a code unit boundary ends the string
+    while nul != -1 and (nul - start) % 2:
+        nul = data.find(b'\x00\x00', nul + 1, end)
+    return end if nul == -1 else nul
 
 
 class PEHeader:
     """Parser for Windows Portable Executable (PE) headers"""
     
+    __slots__ = ('file_path', 'file_size', 'pe_header_offset', 'is_64bit', 'sections', 'version_info', 'errors')
+    
+    # Readable names for COFF machine types
+    MACHINE_NAMES = {
+        0x014c: 'x86',
+        0x0200: 'Intel Itanium',
+        0x8664: 'x64 (AMD64)',
+        0xAA64: 'ARM64',
+        0x01c0: 'ARM',
+        0x01c4: 'ARMv7'
+    }
+    
+    # Version resource keys, located together in a single pass over the file
+    VERSION_KEYS = (
+        b'FileVersion\x00',
+        b'ProductVersion\x00',
+        b'CompanyName\x00',
+        b'FileDescription\x00',
+        b'ProductName\x00'
+    )
+    VERSION_KEY_RE = re.compile(b'|'.join(map(re.escape, VERSION_KEYS)))
+    
+    RT_VERSION = 16  # Resource type id of VS_VERSIONINFO
+    
+    # The fallback string scan only looks at the end of the file, where the
+    # linker places .rsrc; images with resources at the front are missed
+    VERSION_SCAN_WINDOW = 1 << 20
+    
+    # Longest version string value accepted by the string scan, in bytes
+    VERSION_VALUE_LIMIT = 512
+    
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.file_size = os.path.getsize(file_path)
@@ -20,122 +103,272 @@ class PEHeader:
         self.is_64bit = False
         self.sections = []
         self.version_info = {}
+        self.errors: List[str] = []  # Recorded rather than printed, for worker processes
         
-    def read(self) -> Dict[str, Any]:
-        """Read PE headers and extract metadata"""
+    def read(self, mm: Optional[mmap.mmap] = None) -> Dict[str, Any]:
+        """Read PE headers and extract metadata
+
+        Args:
+            mm: Optional read-only memory map of the file. When omitted the
+                file is mapped for the duration of the call.
+        """
+        if mm is None:
+            if not self.file_size:
+                # Empty files cannot be mapped and carry no headers
+                return None
+            try:
+                with open(self.file_path, 'rb') as f:
+                    with map_file(f) as mm:
+                        return self.read(mm)
+            except (OSError, ValueError) as e:
+                self.errors.append(f"Error reading PE headers: {e}")
+                return None
+
         try:
-            with open(self.file_path, 'rb') as f:
-                # Check DOS header
-                dos_header = f.read(2)
-                if dos_header != b'MZ':
-                    return None
-                    
-                # Get PE header offset
-                f.seek(0x3C)
-                self.pe_header_offset = struct.unpack('<I', f.read(4))[0]
-                
-                # Read PE signature
-                f.seek(self.pe_header_offset)
-                pe_sig = f.read(4)
-                if pe_sig != b'PE\x00\x00':
-                    return None
-                    
-                # Read COFF header
-                machine_type = struct.unpack('<H', f.read(2))[0]
-                self.is_64bit = machine_type == 0x8664  # AMD64
-                
-                num_sections = struct.unpack('<H', f.read(2))[0]
-                timestamp = struct.unpack('<I', f.read(4))[0]
-                
-                # Skip to optional header
-                f.seek(self.pe_header_offset + 24)
-                magic = struct.unpack('<H', f.read(2))[0]
-                
-                if magic == 0x10b:  # PE32
-                    self.is_64bit = False
-                elif magic == 0x20b:  # PE32+
-                    self.is_64bit = True
-                    
-                # Try to find version info in resources
-                self._read_version_resources(f)
-                
-                return {
-                    'is_64bit': self.is_64bit,
-                    'machine_type': self._get_machine_name(machine_type),
-                    'timestamp': datetime.fromtimestamp(timestamp).isoformat() if timestamp else None,
-                    'file_size': self.file_size,
-                    'version_info': self.version_info
-                }
-                
+            # Check DOS header
+            if mm[:2] != b'MZ':
+                return None
+
+            # Get PE header offset
+            self.pe_header_offset = offset = _U32.unpack_from(mm, 0x3C)[0]
+            if offset + _PE_HEADER.size > len(mm):
+                return None
+
+            # Read PE signature and COFF header
+            (signature, machine_type, num_sections, timestamp,
+             _, _, size_of_optional_header, _) = _PE_HEADER.unpack_from(mm, offset)
+            if signature != b'PE\x00\x00':
+                return None
+            self.is_64bit = machine_type == 0x8664  # AMD64
+
+            # Skip to optional header
+            optional_header = offset + _PE_HEADER.size
+            magic = _U16.unpack_from(mm, optional_header)[0]
+
+            if magic == 0x10b:  # PE32
+                self.is_64bit = False
+            elif magic == 0x20b:  # PE32+
+                self.is_64bit = True
+
+            self._read_sections(mm, optional_header + size_of_optional_header, num_sections)
+
+            # Read version info from the resource table, falling back to a
+            # string scan for images whose resource table cannot be walked
+            if not self._read_version_resources(mm, optional_header, magic):
+                self._scan_version_strings(mm)
+
+            return {
+                'is_64bit': self.is_64bit,
+                'machine_type': self._get_machine_name(machine_type),
+                'timestamp': datetime.fromtimestamp(timestamp).isoformat() if timestamp else None,
+                'file_size': self.file_size,
+                'version_info': self.version_info
+            }
+
         except Exception as e:
-            print(f"Error reading PE headers: {e}")
+            self.errors.append(f"Error reading PE headers: {e}")
             return None
-            
+
     def _get_machine_name(self, machine_type: int) -> str:
         """Convert machine type to readable name"""
-        machines = {
-            0x014c: 'x86',
-            0x0200: 'Intel Itanium',
-            0x8664: 'x64 (AMD64)',
-            0xAA64: 'ARM64',
-            0x01c0: 'ARM',
-            0x01c4: 'ARMv7'
-        }
-        return machines.get(machine_type, f'Unknown ({hex(machine_type)})')
+        return self.MACHINE_NAMES.get(machine_type, f'Unknown ({hex(machine_type)})')
+        
+    def _read_sections(self, data, table_offset: int, num_sections: int):
+        """Read the section table that follows the optional header"""
+        self.sections = []
+        for i in range(num_sections):
+            name, virtual_size, virtual_address, raw_size, raw_offset = _SECTION_HEADER.unpack_from(
+                data, table_offset + i * _SECTION_HEADER_SIZE)
+            self.sections.append({
+                'name': name.rstrip(b'\x00').decode('ascii', errors='ignore'),
+                'virtual_address': virtual_address,
+                'virtual_size': virtual_size,
+                'raw_size': raw_size,
+                'raw_offset': raw_offset
+            })
+            
+    def _rva_to_offset(self, rva: int) -> Optional[int]:
+        """Translate a relative virtual address to a file offset"""
+        for section in self.sections:
+            start = section['virtual_address']
+            if start <= rva < start + max(section['virtual_size'], section['raw_size']):
+                return rva - start + section['raw_offset']
+        return None
         
-    def _read_version_resources(self, f):
-        """Attempt to read version information from resources"""
-        # This is a simplified version - full resource parsing is complex
+    def _read_version_resources(self, data, optional_header: int, magic: int) -> bool:
+        """
+        Read version information from the RT_VERSION resource
+        
+        Only the resource directory and the VS_VERSIONINFO block are touched,
+        so the cost does not depend on the size of the DLL.
+        
+        Returns:
+            True if a version resource was found and parsed
+        """
         try:
-            # Search for version info patterns in the file
-            f.seek(0)
-            data = f.read()
+            # Resource table is entry 2 of the data directory
+            directory = optional_header + (96 if magic == 0x10b else 112)
+            count = _U32.unpack_from(data, directory - 4)[0]
+            if count <= 2:
+                return False
+            resource_rva, resource_size = _U32_PAIR.unpack_from(data, directory + 2 * _U32_PAIR.size)
+            if not resource_rva or not resource_size:
+                return False
+            base = self._rva_to_offset(resource_rva)
+            if base is None:
+                return False
+                
+            # Walk type -> name -> language, taking the first name and language
+            entry = self._find_resource_entry(data, base, base, self.RT_VERSION)
+            for _ in range(2):
+                if entry is None or not entry & 0x80000000:
+                    return False
+                entry = self._find_resource_entry(data, base, base + (entry & 0x7FFFFFFF))
+            if entry is None or entry & 0x80000000:
+                return False
+                
+            # Leaf is an IMAGE_RESOURCE_DATA_ENTRY pointing at VS_VERSIONINFO
+            blob_rva, blob_size = _U32_PAIR.unpack_from(data, base + entry)
+            blob_offset = self._rva_to_offset(blob_rva)
+            if blob_offset is None:
+                return False
+            self._parse_version_info(data, blob_offset, min(blob_size, len(data) - blob_offset))
+            return bool(self.version_info)
+            
+        except (struct.error, IndexError, ValueError):
+            return False
             
-            # Look for common version patterns
-            patterns = [
-                b'FileVersion\x00',
-                b'ProductVersion\x00',
-                b'CompanyName\x00',
-                b'FileDescription\x00',
-                b'ProductName\x00'
-            ]
+    def _find_resource_entry(self, data, base: int, directory: int, entry_id: Optional[int] = None) -> Optional[int]:
+        """
+        Find an entry in an IMAGE_RESOURCE_DIRECTORY
+        
+        Returns the entry's OffsetToData field for the entry with the given
+        numeric id, or for the first entry when no id is given.
+        """
+        named, ids = _U16_PAIR.unpack_from(data, directory + 12)
+        for i in range(named + ids):
+            name, offset = _U32_PAIR.unpack_from(data, directory + 16 + i * _U32_PAIR.size)
+            if entry_id is None or name == entry_id:
+                return offset
+        return None
+        
+    def _parse_version_info(self, data, start: int, size: int):
+        """Parse the StringFileInfo strings out of a VS_VERSIONINFO block"""
+        end = start + size
+        
+        # Strings are decoded straight from a view of the mapping, without
+        # copying each slice first; the view must be released before the
+        # mapping is closed
+        with memoryview(data) as view:
+            
+            def decode(a, b):
+                return str(view[a:b], 'utf-16-le', 'ignore')
+                
+            def align(pos):
+                return start + ((pos - start + 3) & ~3)
+                
+            def read_block(pos, limit):
+                # Each block is wLength, wValueLength, wType, a NUL-terminated
+                # UTF-16 key, then the value and children on 32-bit boundaries
+                length, value_length, value_type = _VERSION_BLOCK.unpack_from(data, pos)
+                block_end = min(pos + length, limit)
+                key_end = find_utf16_end(data, pos + 6, block_end)
+                return length, value_length, value_type, decode(pos + 6, key_end), align(key_end + 2), block_end
+                
+            def children(pos, limit):
+                while pos + 6 <= limit:
+                    block = read_block(pos, limit)
+                    if block[0] == 0:
+                        break
+                    yield block
+                    pos = align(pos + block[0])
+                    
+            _, value_length, _, key, value_start, root_end = read_block(start, end)
+            if key != 'VS_VERSION_INFO':
+                return
+                
+            for _, _, _, child_key, child_start, child_end in children(align(value_start + value_length), root_end):
+                if child_key != 'StringFileInfo':
+                    continue
+                for _, _, _, _, table_start, table_end in children(child_start, child_end):
+                    for _, _, _, name, string_start, string_end in children(table_start, table_end):
+                        value = decode(string_start, string_end).rstrip('\x00')
+                        if name and value:
+                            self.version_info.setdefault(name, value)
+                            
+    def _scan_version_strings(self, data):
+        """Attempt to read version information by scanning for key strings"""
+        # This is a heuristic for images without a usable resource table
+        try:
+            # Locate the first occurrence of every version key in one pass
+            # over the tail of the file
+            window_start = max(0, len(data) - self.VERSION_SCAN_WINDOW)
+            found = find_first(self.VERSION_KEY_RE, data, len(self.VERSION_KEYS), window_start)
             
-            for pattern in patterns:
-                index = data.find(pattern)
+            for pattern in self.VERSION_KEYS:
+                index = found.get(pattern, -1)
                 if index != -1:
-                    # Try to extract the string value after the pattern
-                    start = index + len(pattern)
-                    # Skip null bytes
-                    while start < len(data) and data[start] == 0:
-                        start += 1
-                    # Read until next null byte sequence
-                    end = start
-                    while end < len(data) - 1:
-                        if data[end] == 0 and data[end + 1] == 0:
-                            break
-                        end += 1
+                    # Try to extract the string value after the pattern,
+                    # skipping null padding; version fields are short
+                    window = data[index + len(pattern):index + len(pattern) + 2 * self.VERSION_VALUE_LIMIT]
+                    tail = window.lstrip(b'\x00')[:self.VERSION_VALUE_LIMIT]
+                    # Read until the UTF-16 terminator
+                    end = find_utf16_end(tail, 0, len(tail))
                     
-                    if end > start:
-                        try:
-                            value = data[start:end].decode('utf-16-le', errors='ignore').strip('\x00')
-                            if value and len(value) < 256:  # Sanity check
-                                key = pattern.decode('ascii', errors='ignore').strip('\x00')
-                                self.version_info[key] = value
-                        except:
-                            pass
+                    if 0 < end < len(tail):
+                        value = tail[:end].decode('utf-16-le', errors='ignore')
+                        if value:
+                            key = pattern.decode('ascii', errors='ignore').strip('\x00')
+                            self.version_info[key] = value
                             
         except Exception as e:
-            print(f"Error reading version resources: {e}")
+            self.errors.append(f"Error reading version resources: {e}")
 
 
 class VST2DllReader:
     """Specialized reader for VST2 DLL files"""
     
+    __slots__ = ('dll_path', 'pe_reader', 'errors')
+    
     VST_MAGIC = 0x56737450  # 'VstP' in little-endian
     
+    # VST-specific exports, most selective first; export names are
+    # NUL-terminated in the export name table
+    VST_EXPORTS = (
+        b'VSTPluginMain',
+        b'main\x00',
+        b'GetPluginFactory'  # Some VST2.4 plugins
+    )
+    
+    # Common VST2 effect categories
+    CATEGORIES = {
+        b'kPlugCategEffect': 'Effect',
+        b'kPlugCategSynth': 'Synth',
+        b'kPlugCategAnalysis': 'Analysis',
+        b'kPlugCategMastering': 'Mastering',
+        b'kPlugCategRoomFx': 'Room Effect',
+        b'kPlugCategRestoration': 'Restoration',
+        b'kPlugCategGenerator': 'Generator'
+    }
+    
+    # Opcode names that tend to sit near the plugin's own strings
+    NAME_PATTERNS = (
+        b'effGetEffectName',
+        b'effGetProductString',
+        b'effGetVendorString'
+    )
+    
+    # Any of these marks the DLL as a VST2 plugin; checked in order
+    VST_MARKERS = VST_EXPORTS + (_U32.pack(VST_MAGIC),)
+    
+    # Category and name signatures are located in a single pass over the DLL
+    SIGNATURES = tuple(CATEGORIES) + NAME_PATTERNS
+    SIGNATURE_RE = re.compile(b'|'.join(map(re.escape, SIGNATURES)))
+    
     def __init__(self, dll_path: str):
         self.dll_path = dll_path
         self.pe_reader = PEHeader(dll_path)
+        self.errors: List[str] = []
         
     def read_metadata(self) -> Dict[str, Any]:
         """Read VST2-specific metadata from DLL"""
@@ -145,127 +378,150 @@ class VST2DllReader:
             'is_vst': False
         }
         
+        # Empty files cannot be mapped and carry no metadata
+        if not self.pe_reader.file_size:
+            return metadata
+            
+        # Map the DLL once and share the mapping across all passes
+        try:
+            with open(self.dll_path, 'rb') as f:
+                with map_file(f) as mm:
+                    self._read_mapped(mm, metadata)
+        except (OSError, ValueError) as e:
+            # Often transient (e.g. locked by a host); recorded so it isn't cached
+            metadata['error'] = f"Error mapping DLL: {e}"
+        
+        # Non-fatal problems are returned for the caller to report
+        warnings = self.pe_reader.errors + self.errors
+        if warnings:
+            metadata['warnings'] = warnings
+            
+        return metadata
+        
+    def _read_mapped(self, mm: mmap.mmap, metadata: Dict[str, Any]):
+        """Fill metadata from a read-only mapping of the DLL"""
         # Read PE headers
-        pe_info = self.pe_reader.read()
+        pe_info = self.pe_reader.read(mm)
         if pe_info:
             metadata.update(pe_info)
             
-        # Try to detect VST2 signature
-        if self._check_vst_signature():
-            metadata['is_vst'] = True
-            metadata['plugin_type'] = 'VST2'
+        # Try to detect VST2 signature; other DLLs need no further scanning
+        if not self._check_vst_signature(mm):
+            return
+        metadata['is_vst'] = True
+        metadata['plugin_type'] = 'VST2'
             
         # Extract additional VST info if possible
-        vst_info = self._extract_vst_info()
+        found = find_first(self.SIGNATURE_RE, mm, len(self.SIGNATURES))
+        vst_info = self._extract_vst_info(mm, found)
         if vst_info:
             metadata.update(vst_info)
-            
-        return metadata
         
-    def _check_vst_signature(self) -> bool:
+    def _check_vst_signature(self, data) -> bool:
         """Check if DLL contains VST2 signature"""
-        try:
-            with open(self.dll_path, 'rb') as f:
-                data = f.read()
-                
-                # Look for VST-specific exports
-                vst_exports = [
-                    b'VSTPluginMain',
-                    b'main',
-                    b'GetPluginFactory'  # Some VST2.4 plugins
-                ]
-                
-                for export in vst_exports:
-                    if export in data:
-                        return True
-                        
-                # Look for VST magic number
-                if struct.pack('<I', self.VST_MAGIC) in data:
-                    return True
-                    
-        except Exception as e:
-            print(f"Error checking VST signature: {e}")
-            
+        # Look for VST-specific exports or the VST magic number, stopping at
+        # the first hit; mmap.find scans the mapping without copying it
+        for marker in self.VST_MARKERS:
+            if data.find(marker) != -1:
+                return True
         return False
         
-    def _extract_vst_info(self) -> Dict[str, Any]:
+    def _extract_vst_info(self, data, found: Dict[bytes, int]) -> Dict[str, Any]:
         """Extract VST-specific information"""
         info = {}
         
         try:
-            with open(self.dll_path, 'rb') as f:
-                data = f.read()
-                
-                # Look for common VST2 effect categories
-                categories = {
-                    b'kPlugCategEffect': 'Effect',
-                    b'kPlugCategSynth': 'Synth',
-                    b'kPlugCategAnalysis': 'Analysis',
-                    b'kPlugCategMastering': 'Mastering',
-                    b'kPlugCategRoomFx': 'Room Effect',
-                    b'kPlugCategRestoration': 'Restoration',
-                    b'kPlugCategGenerator': 'Generator'
-                }
-                
-                for cat_bytes, cat_name in categories.items():
-                    if cat_bytes in data:
-                        info['category'] = cat_name
-                        break
-                        
-                # Try to find plugin name in strings
-                # This is heuristic-based and may not always work
-                name_patterns = [
-                    b'effGetEffectName',
-                    b'effGetProductString',
-                    b'effGetVendorString'
-                ]
-                
-                for pattern in name_patterns:
-                    index = data.find(pattern)
-                    if index != -1:
-                        # Look for readable strings near this pattern
-                        window_start = max(0, index - 1000)
-                        window_end = min(len(data), index + 1000)
-                        window = data[window_start:window_end]
-                        
-                        # Extract potential strings
-                        strings = self._extract_strings(window, min_length=4, max_length=64)
-                        if strings:
-                            # Filter for likely plugin names
-                            for s in strings:
-                                if not s.startswith('eff') and not s.startswith('kPlug'):
-                                    if 'plugin_name' not in info:
-                                        info['plugin_name'] = s
-                                    break
-                                    
+            for cat_bytes, cat_name in self.CATEGORIES.items():
+                if cat_bytes in found:
+                    info['category'] = cat_name
+                    break
+                    
+            # Try to find plugin name in strings
+            # This is heuristic-based and may not always work
+            for pattern in self.NAME_PATTERNS:
+                index = found.get(pattern, -1)
+                if index != -1:
+                    # Look for readable strings near this pattern
+                    window_start = max(0, index - 1000)
+                    window_end = min(len(data), index + 1000)
+                    window = data[window_start:window_end]
+                    
+                    # Extract potential strings
+                    strings = self._extract_strings(window, min_length=4, max_length=64)
+                    if strings:
+                        # Filter for likely plugin names
+                        for s in strings:
+                            if not s.startswith('eff') and not s.startswith('kPlug'):
+                                if 'plugin_name' not in info:
+                                    info['plugin_name'] = s
+                                break
+                                
         except Exception as e:
-            print(f"Error extracting VST info: {e}")
+            self.errors.append(f"Error extracting VST info: {e}")
             
         return info
         
     def _extract_strings(self, data: bytes, min_length: int = 4, max_length: int = 256) -> List[str]:
         """Extract ASCII strings from binary data"""
-        strings = []
-        current = []
-        
-        for byte in data:
-            if 32 <= byte <= 126:  # Printable ASCII
-                current.append(chr(byte))
-                if len(current) > max_length:
-                    current = []
-            else:
-                if len(current) >= min_length:
-                    strings.append(''.join(current))
-                current = []
-                
-        if len(current) >= min_length:
-            strings.append(''.join(current))
-            
-        return strings
+        return [match.group().decode('ascii') for match in _printable_run_re(min_length, max_length).finditer(data)]
+
+
+@lru_cache(maxsize=None)
+def _printable_run_re(min_length: int, max_length: int) -> re.Pattern:
+    """Compile a pattern matching whole runs of printable ASCII of a bounded length"""
+    return re.compile(rb'(?<![\x20-\x7e])[\x20-\x7e]{%d,%d}(?![\x20-\x7e])' % (min_length, max_length))
+
+
+# Version of the results stored in the DLL cache; bump it whenever a change
+# to the parsing would change them, so older cached results are dropped
+_CACHE_VERSION = 1
+
+# Smallest file treated as a candidate PE image; real DLLs are far larger
+_MIN_PE_SIZE = 4096
+
+
+def _is_pe(path: str) -> bool:
+    """Check for the 'MZ' DOS signature without parsing the file, raising OSError if it can't be read"""
+    with open(path, 'rb') as f:
+        return f.read(2) == b'MZ'
+
+
+def _walk_dlls(root: str):
+    """Yield a DirEntry for every .dll file below root, without following symlinks"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith('.dll'):
+                        yield entry
+        except OSError as e:
+            print(f"Error reading directory: {e}")
+
 
+def _read_vst_dll(dll_path: str) -> Dict[str, Any]:
+    """Read a single DLL in a worker process, returning errors instead of raising"""
+    try:
+        return VST2DllReader(dll_path).read_metadata()
+    except Exception as e:
+        return {'path': dll_path, 'filename': Path(dll_path).name, 'is_vst': False, 'error': str(e)}
 
-def scan_vst_dlls(directory: str) -> List[Dict[str, Any]]:
-    """Scan a directory for VST2 DLL files"""
+
+def scan_vst_dlls(directory: str, max_workers: Optional[int] = None, use_cache: bool = False) -> List[Dict[str, Any]]:
+    """
+    Scan a directory for VST2 DLL files
+    
+    DLLs are parsed in parallel across a process pool. With use_cache,
+    results are cached by path, modification time and size, so only new or
+    changed DLLs are parsed on repeat scans.
+    
+    Args:
+        directory: Directory to scan recursively
+        max_workers: Number of worker processes (default: one per CPU)
+        use_cache: Whether to use the persistent metadata cache (default: off)
+    """
     results = []
     path = Path(directory)
     
@@ -273,17 +529,66 @@ def scan_vst_dlls(directory: str) -> List[Dict[str, Any]]:
         print(f"Directory does not exist: {directory}")
         return results
         
-    for dll_path in path.glob("**/*.dll"):
-        try:
-            reader = VST2DllReader(str(dll_path))
-            metadata = reader.read_metadata()
-            
-            if metadata.get('is_vst'):
-                results.append(metadata)
-                print(f"Found VST: {dll_path.name}")
+    dll_entries = list(_walk_dlls(str(path)))
+    dll_paths = [entry.path for entry in dll_entries]
+    if not dll_paths:
+        return results
+        
+    cache = MetadataCache('vst_cache', version=_CACHE_VERSION)
+    if use_cache:
+        cache.open()
+        
+    try:
+        # Serve unchanged DLLs from the cache, reject files that cannot be
+        # PE images and queue the rest for parsing
+        scanned = {}
+        stats = {}
+        pending = []
+        for entry in dll_entries:
+            dll_path = entry.path
+            try:
+                # DirEntry.stat() reuses the directory listing on Windows
+                stats[dll_path] = entry.stat()
+            except OSError as e:
+                scanned[dll_path] = {'path': dll_path, 'error': str(e)}
+                continue
+            cached = cache.get(dll_path, stats[dll_path])
+            if cached is not None:
+                scanned[dll_path] = cached
+                continue
+            try:
+                is_candidate = stats[dll_path].st_size >= _MIN_PE_SIZE and _is_pe(dll_path)
+            except OSError as e:
+                # Not cached, so a locked DLL is read again on the next scan
+                scanned[dll_path] = {'path': dll_path, 'error': str(e)}
+                continue
+            if is_candidate:
+                pending.append(dll_path)
+            else:
+                scanned[dll_path] = {'path': dll_path, 'filename': entry.name, 'is_vst': False}
+                cache.put(dll_path, stats[dll_path], scanned[dll_path])
                 
-        except Exception as e:
-            print(f"Error reading {dll_path}: {e}")
+        if pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for dll_path, metadata in zip(pending, executor.map(_read_vst_dll, pending, chunksize=16)):
+                    # Only results read without an error are cached
+                    if 'error' not in metadata:
+                        cache.put(dll_path, stats[dll_path], metadata)
+                    scanned[dll_path] = metadata
+    finally:
+        cache.close()
+        
+    for dll_path in dll_paths:
+        metadata = scanned[dll_path]
+        for warning in metadata.get('warnings', ()):
+            print(f"Problem reading {dll_path}: {warning}")
+        if 'error' in metadata:
+            print(f"Error reading {dll_path}: {metadata['error']}")
+            continue
+            
+        if metadata.get('is_vst'):
+            results.append(metadata)
+            print(f"Found VST: {metadata['filename']}")
             
     return results
 
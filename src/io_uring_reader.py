@@ -0,0 +1,117 @@
+"""
+io_uring Reader
+Batch whole-file reads through Linux io_uring, so reading hundreds of small
+manifest files costs a few submissions instead of a read syscall per file.
+Falls back to plain reads when liburing or kernel support is missing.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+# Try to import liburing for io_uring support (Linux only)
+try:
+    from liburing import (
+        Ring, Cqe,
+        io_uring_queue_init, io_uring_queue_exit,
+        io_uring_get_sqe, io_uring_prep_read, io_uring_sqe_set_data64,
+        io_uring_submit, io_uring_wait_cqe, io_uring_cqe_get_data64, io_uring_cqe_seen
+    )
+    HAS_LIBURING = True
+except ImportError:
+    HAS_LIBURING = False
+
+# Number of reads submitted per batch
+QUEUE_DEPTH = 256
+
+_SUPPORTED = None
+
+
+def io_uring_supported() -> bool:
+    """Check once whether liburing is installed and the kernel allows io_uring"""
+    global _SUPPORTED
+    if _SUPPORTED is None:
+        _SUPPORTED = False
+        if HAS_LIBURING:
+            ring = Ring()
+            try:
+                io_uring_queue_init(1, ring)
+            except OSError:
+                pass  # Old kernel, or io_uring disabled by policy
+            else:
+                io_uring_queue_exit(ring)
+                _SUPPORTED = True
+    return _SUPPORTED
+
+
+def _read_file(path: Union[str, Path]) -> Optional[bytes]:
+    """Read a whole file, or None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def read_many(paths: Sequence[Union[str, Path]]) -> List[Optional[bytes]]:
+    """
+    Read many whole files
+
+    Args:
+        paths: Files to read
+
+    Returns:
+        Contents of each file in the same order, or None for files that
+        could not be read
+    """
+    if not io_uring_supported():
+        return [_read_file(path) for path in paths]
+
+    results = [None] * len(paths)
+    ring = Ring()
+    cqe = Cqe()
+    io_uring_queue_init(QUEUE_DEPTH, ring)
+    try:
+        for batch_start in range(0, len(paths), QUEUE_DEPTH):
+            fds = {}
+            buffers = {}
+            try:
+                for index in range(batch_start, min(batch_start + QUEUE_DEPTH, len(paths))):
+                    try:
+                        fd = os.open(paths[index], os.O_RDONLY)
+                    except OSError:
+                        continue
+                    fds[index] = fd
+
+                    size = os.fstat(fd).st_size
+                    if size == 0:
+                        results[index] = b''
+                        continue
+
+                    buffers[index] = bytearray(size)
+                    sqe = io_uring_get_sqe(ring)
+                    io_uring_prep_read(sqe, fd, buffers[index], 0)
+                    io_uring_sqe_set_data64(sqe, index)
+
+                if buffers:
+                    io_uring_submit(ring)
+
+                for _ in range(len(buffers)):
+                    io_uring_wait_cqe(ring, cqe)
+                    entry = cqe[0]
+                    index = io_uring_cqe_get_data64(entry)
+                    count = entry.res
+                    io_uring_cqe_seen(ring, entry)
+
+                    if count == len(buffers[index]):
+                        results[index] = bytes(buffers[index])
+                    else:
+                        # Error or short read (file changed size); read normally
+                        results[index] = _read_file(paths[index])
+            finally:
+                for fd in fds.values():
+                    os.close(fd)
+    finally:
+        io_uring_queue_exit(ring)
+
+    return results
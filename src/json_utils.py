@@ -7,11 +7,24 @@ Provides robust JSON parsing with support for common JSON variations including:
 - Single quotes (with json5)
 """
 
+import atexit
+import codecs
 import json
+import os
 import re
-from typing import Dict, Any, Optional, Union
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    from metadata_cache import MetadataCache
+    from io_uring_reader import io_uring_supported, read_many
+except ImportError:
+    from .metadata_cache import MetadataCache
+    from .io_uring_reader import io_uring_supported, read_many
+
 # Try to import json5 for more lenient parsing
 try:
     import json5
@@ -19,6 +32,159 @@ try:
 except ImportError:
     HAS_JSON5 = False
 
+# Try to import orjson for faster parsing of well-formed files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Byte order marks and the codecs they imply; UTF-32 LE must precede UTF-16 LE
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Anything that may sit between a trailing comma and the closing bracket
+_TRAILING_GAP = r'(?:\s|,|//[^\n]*|/\*.*?\*/)*'
+
+# Single-pass tokenizer used by JSONParser.clean_json_string
+_CLEANER = re.compile(
+    r'(?P<string>"(?:[^"\\]|\\.)*")'            # quoted string, kept
+    r'|//[^\n]*'                                # single-line comment
+    r'|/\*.*?\*/'                               # multi-line comment
+    r'|,(?=' + _TRAILING_GAP + r'[}\]])',       # trailing comma
+    re.DOTALL
+)
+
+# Quoted strings that clean_json_string would leave untouched
+_PLAIN_STRING = re.compile(r'"(?:[^"\\\n\r\t\b\f]|\\[^\n\r\t\b\f])*"')
+
+# Once plain strings are removed, anything clean_json_string would change
+# shows up as a leftover quote, a slash or a trailing comma
+_NEEDS_CLEANING = re.compile(r'["/]|,(?=[\s,]*[}\]])')
+
+# Quoted strings (kept) or whitespace next to a colon or comma (dropped)
+_WS_TRIM = re.compile(r'("(?:[^"\\]|\\.)*")|\s+(?=[:,])|(?<=[:,])\s+', re.DOTALL)
+
+# Anything outside string.printable, blanked by the aggressive cleanup
+_NON_PRINTABLE = re.compile('[^' + re.escape(string.printable) + ']')
+
+# Bare identifier keys, quoted by the aggressive cleanup in JSONParser.parse
+_UNQUOTED_KEY = re.compile(r'([,\{\s])([a-zA-Z_][a-zA-Z0-9_]*)\s*:')
+
+# Candidate starts for extract_json_objects
+_OPEN_BRACKET = re.compile(r'[\{\[]')
+
+# Common manifest field name variations for each standard name, in priority order
+_MANIFEST_FIELDS = {
+    'name': ['Name', 'name', 'plugin_name', 'pluginName', 'displayName'],
+    'version': ['Version', 'version', 'plugin_version', 'pluginVersion'],
+    'vendor': ['Vendor', 'vendor', 'manufacturer', 'Manufacturer', 'company', 'Company'],
+    'description': ['Description', 'description', 'desc', 'info', 'about'],
+    'category': ['Category', 'category', 'type', 'plugin_type', 'pluginType'],
+}
+
+# Each variation mapped to its standard name and priority
+_FIELD_MAP = {
+    field: (standard, rank)
+    for standard, fields in _MANIFEST_FIELDS.items()
+    for rank, field in enumerate(fields)
+}
+
+# Tokens for extract_json_objects: a string (possibly unterminated), an
+# escaped character, or a bracket of the kind being matched (group 1)
+_SKIPPED_TOKENS = r'"(?:[^"\\]|\\.)*(?:"|\\?\Z)|\\.'
+_BRACKET_SCANNERS = {
+    '{': re.compile(_SKIPPED_TOKENS + r'|([{}])', re.DOTALL),
+    '[': re.compile(_SKIPPED_TOKENS + r'|([\[\]])', re.DOTALL),
+}
+_ANY_BRACKET = re.compile(_SKIPPED_TOKENS + r'|([{}\[\]])', re.DOTALL)
+_OPENERS = {'}': '{', ']': '['}
+
+# Whitespace allowed around a JSON document
+_JSON_WHITESPACE = b' \t\n\r'
+
+
+def _looks_like_container(data: bytes) -> bool:
+    """Check that data starts and ends like a JSON object or array, without copying it"""
+    start, end = 0, len(data)
+    while start < end and data[start] in _JSON_WHITESPACE:
+        start += 1
+    while end > start and data[end - 1] in _JSON_WHITESPACE:
+        end -= 1
+    return end - start >= 2 and data[start] in b'{[' and data[end - 1] in b'}]'
+
+
+def _escape_control_chars(string: str) -> str:
+    """Escape raw control characters inside a quoted string"""
+    # str.replace returns the same object when there is nothing to replace,
+    # so plain strings pass through without any allocation
+    return (string.replace('\n', '\\n')
+                  .replace('\r', '\\r')
+                  .replace('\t', '\\t')
+                  .replace('\b', '\\b')
+                  .replace('\f', '\\f'))
+
+
+def _match_brackets(content: str) -> Dict[int, Optional[int]]:
+    """
+    Pair every bracket that opens outside a string with its closing bracket
+    
+    Each bracket kind is counted on its own, as extract_json_objects does.
+    One pass over the content settles string and escape state for all
+    brackets at once instead of rescanning from each one.
+    
+    Returns:
+        Map of opening bracket position to the end of its match, or None
+        if it is never closed
+    """
+    ends: Dict[int, Optional[int]] = {}
+    stacks: Dict[str, List[int]] = {'{': [], '[': []}
+    for token in _ANY_BRACKET.finditer(content):
+        char = token.group(1)
+        if char is None:
+            continue
+        if char in stacks:
+            stacks[char].append(token.start())
+            ends[token.start()] = None
+        else:
+            stack = stacks[_OPENERS[char]]
+            if stack:
+                ends[stack.pop()] = token.end()
+    return ends
+
+
+def _find_closing_bracket(content: str, start: int) -> Optional[int]:
+    """Find the end of the bracket matching content[start], or None"""
+    open_char = content[start]
+    bracket_count = 0
+    for token in _BRACKET_SCANNERS[open_char].finditer(content, start):
+        char = token.group(1)
+        if char is None:
+            continue
+        if char == open_char:
+            bracket_count += 1
+            continue
+        bracket_count -= 1
+        if bracket_count == 0:
+            return token.end()
+    return None
+
+
+def _keep_string(match: re.Match) -> str:
+    """Replacement for _CLEANER matches: keep strings, drop everything else"""
+    return match.group('string') or ''
+
+
+def _clean_token(match: re.Match) -> str:
+    """Replacement for _CLEANER matches: escape strings, drop everything else"""
+    string = match.group('string')
+    return _escape_control_chars(string) if string is not None else ''
+
 
 class JSONParser:
     """Robust JSON parser that handles common variations and errors"""
@@ -35,40 +201,24 @@ class JSONParser:
         - BOM (Byte Order Mark)
         - Control characters in strings
         """
+        # Fast path: most manifests have nothing to strip or escape
+        if not content.startswith('\ufeff') and not _NEEDS_CLEANING.search(_PLAIN_STRING.sub('', content)):
+            return content.strip()
+        
         # Remove BOM if present
         if content.startswith('\ufeff'):
             content = content[1:]
         
-        # Remove single-line comments (// comment)
-        # But preserve URLs (http://, https://, file://)
-        content = re.sub(r'(?<!:)//.*?$', '', content, flags=re.MULTILINE)
-        
-        # Remove multi-line comments (/* comment */)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-        
-        # Remove trailing commas before closing braces/brackets
-        # This handles multiple passes to catch nested cases
-        prev_content = None
-        while prev_content != content:
-            prev_content = content
-            # Remove trailing comma before } or ]
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
-        
-        # Escape control characters in strings
-        # This is a more careful approach that only touches string values
-        def escape_control_chars(match):
-            string_content = match.group(1)
-            # Replace actual newlines, tabs, etc. with their escape sequences
-            string_content = string_content.replace('\n', '\\n')
-            string_content = string_content.replace('\r', '\\r')
-            string_content = string_content.replace('\t', '\\t')
-            string_content = string_content.replace('\b', '\\b')
-            string_content = string_content.replace('\f', '\\f')
-            return '"' + string_content + '"'
-        
-        # Only escape control chars within quoted strings, not in the whole content
-        # This regex matches quoted strings while respecting escaped quotes
-        content = re.sub(r'"((?:[^"\\]|\\.)*)?"', escape_control_chars, content)
+        # Walk the content once: comments and trailing commas are dropped,
+        # quoted strings are kept. Matching strings as tokens keeps // and /*
+        # inside values intact.
+        cleaned = _CLEANER.sub(_keep_string, content)
+        
+        # Raw control characters are rare, so only escape them when a kept
+        # string is not plain
+        if '"' in _PLAIN_STRING.sub('', cleaned):
+            cleaned = _CLEANER.sub(_clean_token, content)
+        content = cleaned
         
         # Remove any trailing whitespace
         content = content.strip()
@@ -89,106 +239,143 @@ class JSONParser:
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        try:
+            # Read the raw bytes; both parsers accept them directly
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            codecs.lookup(encoding)
+        except FileNotFoundError:
             print(f"File not found: {file_path}")
             return None
-        
-        try:
-            # Read the file content
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Try with different encodings
-            for alt_encoding in ['utf-8-sig', 'latin-1', 'cp1252']:
-                try:
-                    with open(file_path, 'r', encoding=alt_encoding) as f:
-                        content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-            else:
-                print(f"Could not decode file {file_path} with any known encoding")
-                return None
         except Exception as e:
             print(f"Error reading file {file_path}: {e}")
             return None
         
-        # Try json5 first if available (most lenient)
+        return JSONParser.parse_bytes(data, file_path, encoding)
+    
+    @staticmethod
+    def parse_bytes(data: bytes, file_path: Union[str, Path], encoding: str = 'utf-8') -> Optional[Dict[str, Any]]:
+        """
+        Parse the raw contents of a JSON file with maximum compatibility
+        
+        Args:
+            data: File contents
+            file_path: Path the contents were read from, used in messages
+            encoding: File encoding (default: utf-8)
+            
+        Returns:
+            Parsed JSON as dictionary, or None if parsing fails
+        """
+        # Each step returns on success; error keeps the last strict failure
+        error = None
+        
+        # A byte order mark settles the encoding
+        bom_encoding = next((codec for bom, codec in _BOMS if data.startswith(bom)), None)
+        
+        # Content that does not even start and end like an object or array
+        # (a leading comment, a truncated file) cannot pass a strict parse,
+        # so it goes straight to cleaning. Only UTF-8 without a BOM can be
+        # checked before decoding.
+        checkable = bom_encoding is None and codecs.lookup(encoding).name == 'utf-8'
+        strict_possible = not checkable or _looks_like_container(data)
+        
+        # Well-formed UTF-8 files parse straight from bytes, no decode needed
+        if checkable and strict_possible:
+            # Try orjson first if available (fastest, strict)
+            if HAS_ORJSON:
+                try:
+                    return orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    pass  # Fall back to other methods
+            
+            # Try standard JSON
+            try:
+                return json.loads(data)
+            except json.JSONDecodeError as e:
+                error = e
+            except UnicodeDecodeError:
+                pass  # Decode with a fallback encoding below
+        
+        # Decode only when the content needs cleaning, falling back through
+        # common codecs when there is no byte order mark
+        text_encodings = [encoding, 'utf-8-sig', 'latin-1', 'cp1252']
+        if bom_encoding is not None:
+            text_encodings.insert(0, bom_encoding)
+        
+        for text_encoding in text_encodings:
+            try:
+                content = data.decode(text_encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            print(f"Could not decode file {file_path} with any known encoding")
+            return None
+        
+        if error is None and strict_possible:
+            # Try standard JSON on text the byte parsers have not seen
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError as e:
+                error = e
+        
+        # Clean and try again, unless cleaning only trimmed JSON whitespace
+        # and so would fail exactly like the strict parse above
+        cleaned_content = JSONParser.clean_json_string(content)
+        if cleaned_content != content.strip(' \t\n\r'):
+            try:
+                return json.loads(cleaned_content)
+            except json.JSONDecodeError as e:
+                error = e
+        elif error is None:
+            # The strict parse was skipped, so this is its only attempt
+            try:
+                return json.loads(cleaned_content)
+            except json.JSONDecodeError:
+                pass
+        
+        # Try json5 if available (most lenient, but slow)
         if HAS_JSON5:
             try:
                 return json5.loads(content)
             except Exception:
-                pass  # Fall back to other methods
+                pass  # Fall back to aggressive cleaning
         
-        # Try standard JSON
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            pass  # Try cleaning the content
+        # Try more aggressive cleaning
+        # Handle specific VST3 moduleinfo.json issues
+        # Some files have spaces in keys which is valid JSON but might have other issues
         
-        # Clean and try again
-        cleaned_content = JSONParser.clean_json_string(content)
+        # First, handle potential control characters more aggressively
+        # Replace any control character that's not already escaped
+        cleaned_content = _NON_PRINTABLE.sub(' ', cleaned_content)
+        
+        # Remove all whitespace around colons and commas (but keep spaces in quoted strings)
+        cleaned_content = _WS_TRIM.sub(r'\1', cleaned_content)
+        
+        # Try to fix unquoted keys (simple cases)
+        # This is a basic attempt - json5 handles this better
+        cleaned_content = _UNQUOTED_KEY.sub(r'\1"\2":', cleaned_content)
         
         try:
             return json.loads(cleaned_content)
-        except json.JSONDecodeError as e:
-            # Try more aggressive cleaning
-            try:
-                # Handle specific VST3 moduleinfo.json issues
-                # Some files have spaces in keys which is valid JSON but might have other issues
-                
-                # First, handle potential control characters more aggressively
-                # Replace any control character that's not already escaped
-                import string
-                printable = set(string.printable)
-                cleaned_content = ''.join(char if char in printable else ' ' for char in cleaned_content)
-                
-                # Remove all whitespace around colons and commas (but keep spaces in quoted strings)
-                # This is a more careful approach
-                parts = []
-                in_string = False
-                escape_next = False
-                for i, char in enumerate(cleaned_content):
-                    if escape_next:
-                        parts.append(char)
-                        escape_next = False
-                        continue
-                    if char == '\\':
-                        escape_next = True
-                        parts.append(char)
-                        continue
-                    if char == '"' and not escape_next:
-                        in_string = not in_string
-                        parts.append(char)
-                        continue
-                    if not in_string and char in ' \t\n\r' and i > 0 and i < len(cleaned_content) - 1:
-                        # Check if this whitespace is around : or ,
-                        prev_char = cleaned_content[i-1] if i > 0 else ''
-                        next_char = cleaned_content[i+1] if i < len(cleaned_content) - 1 else ''
-                        if prev_char in ':,' or next_char in ':,':
-                            continue  # Skip this whitespace
-                    parts.append(char)
-                cleaned_content = ''.join(parts)
-                
-                # Try to fix unquoted keys (simple cases)
-                # This is a basic attempt - json5 handles this better
-                cleaned_content = re.sub(
-                    r'([,\{\s])([a-zA-Z_][a-zA-Z0-9_]*)\s*:',
-                    r'\1"\2":',
-                    cleaned_content
-                )
-                
-                return json.loads(cleaned_content)
-            except json.JSONDecodeError:
-                # Last resort: try to extract valid JSON objects/arrays
-                result = JSONParser.extract_json_objects(cleaned_content)
-                if result:
-                    return result[0] if len(result) == 1 else {'objects': result}
-                
-                # Suppress detailed error for common VST3 issues
-                if "moduleinfo.json" not in str(file_path):
-                    print(f"Could not parse JSON from {file_path}: {e}")
-                return None
+        except json.JSONDecodeError:
+            pass  # Try extracting what we can
+        
+        # Last resort: try to extract valid JSON objects/arrays
+        result = JSONParser.extract_json_objects(cleaned_content)
+        if result:
+            return result[0] if len(result) == 1 else {'objects': result}
+        
+        # Suppress detailed error for common VST3 issues
+        if "moduleinfo.json" not in str(file_path):
+            if error is None:
+                # The strict parse was skipped; it only runs now for its message
+                try:
+                    json.loads(content)
+                except json.JSONDecodeError as e:
+                    error = e
+            print(f"Could not parse JSON from {file_path}: {error}")
+        return None
     
     @staticmethod
     def extract_json_objects(content: str) -> list:
@@ -198,108 +385,157 @@ class JSONParser:
         This is useful when dealing with partially corrupted JSON files
         """
         objects = []
+        ends = _match_brackets(content)
         
         # Find potential JSON objects (starting with { or [)
-        for match in re.finditer(r'[\{\[]', content):
+        for match in _OPEN_BRACKET.finditer(content):
             start = match.start()
             
-            # Try to find the matching closing bracket
-            bracket_count = 0
-            in_string = False
-            escape_next = False
-            
-            open_char = content[start]
-            close_char = '}' if open_char == '{' else ']'
+            # Brackets inside strings or after a backslash start with fresh
+            # string state, so they need their own scan
+            if start in ends:
+                end = ends[start]
+            else:
+                end = _find_closing_bracket(content, start)
+            if end is None:
+                continue
             
-            for i in range(start, len(content)):
-                char = content[i]
-                
-                if escape_next:
-                    escape_next = False
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    continue
-                
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                
-                if not in_string:
-                    if char == open_char:
-                        bracket_count += 1
-                    elif char == close_char:
-                        bracket_count -= 1
-                        
-                        if bracket_count == 0:
-                            # Found matching closing bracket
-                            potential_json = content[start:i+1]
-                            try:
-                                obj = json.loads(potential_json)
-                                objects.append(obj)
-                                break
-                            except json.JSONDecodeError:
-                                # Try cleaning this portion
-                                cleaned = JSONParser.clean_json_string(potential_json)
-                                try:
-                                    obj = json.loads(cleaned)
-                                    objects.append(obj)
-                                    break
-                                except json.JSONDecodeError:
-                                    pass
-                            break
+            potential_json = content[start:end]
+            try:
+                objects.append(json.loads(potential_json))
+            except json.JSONDecodeError:
+                # Try cleaning this portion
+                cleaned = JSONParser.clean_json_string(potential_json)
+                try:
+                    objects.append(json.loads(cleaned))
+                except json.JSONDecodeError:
+                    pass
         
         return objects
     
     @staticmethod
-    def parse_plugin_manifest(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    def parse_plugin_manifest(file_path: Union[str, Path], use_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Parse a plugin manifest file (moduleinfo.json, clap.json, etc.)
         
-        These files often have trailing commas and comments
-        """
-        result = JSONParser.parse(file_path)
+        These files often have trailing commas and comments. With use_cache,
+        results are cached by path, modification time and size, in memory
+        and on disk, so unchanged manifests are only parsed once.
         
-        if result:
-            # Normalize common field names
-            normalized = {}
-            
-            # Map common variations to standard names
-            name_fields = ['Name', 'name', 'plugin_name', 'pluginName', 'displayName']
-            version_fields = ['Version', 'version', 'plugin_version', 'pluginVersion']
-            vendor_fields = ['Vendor', 'vendor', 'manufacturer', 'Manufacturer', 'company', 'Company']
-            desc_fields = ['Description', 'description', 'desc', 'info', 'about']
-            category_fields = ['Category', 'category', 'type', 'plugin_type', 'pluginType']
+        Args:
+            file_path: Path to the manifest file
+            use_cache: Whether to use the manifest cache (default: off)
+        """
+        if not use_cache:
+            return JSONParser._parse_plugin_manifest(file_path)
             
-            for field in name_fields:
-                if field in result:
-                    normalized['name'] = result[field]
-                    break
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return JSONParser._parse_plugin_manifest(file_path)
             
-            for field in version_fields:
-                if field in result:
-                    normalized['version'] = result[field]
-                    break
+        key = os.path.abspath(file_path)
+        cache = _manifest_cache()
+        result = cache.get(key, stat_result)
+        if result is None:
+            result = JSONParser._parse_plugin_manifest(file_path)
+            if result is not None:
+                cache.put(key, stat_result, result)
+        return result
+    
+    @staticmethod
+    def parse_many(paths: Iterable[Union[str, Path]], max_workers: Optional[int] = None,
+                   use_cache: bool = False) -> Dict[Path, Optional[Dict[str, Any]]]:
+        """
+        Parse many plugin manifests concurrently
+        
+        Manifest parsing is dominated by file IO on a cold scan. On Linux
+        with liburing the files are read in io_uring batches; otherwise a
+        thread pool overlaps the reads, as the GIL is released while reading.
+        
+        Args:
+            paths: Paths to the manifest files
+            max_workers: Number of threads (default: 4 per CPU, at most 32)
+            use_cache: Whether to use the manifest cache (default: off)
             
-            for field in vendor_fields:
-                if field in result:
-                    normalized['vendor'] = result[field]
-                    break
+        Returns:
+            Map of each path to its parsed manifest, or None if parsing failed
+        """
+        manifest_paths = [Path(path) for path in paths]
+        if not manifest_paths:
+            return {}
+        
+        if io_uring_supported():
+            return JSONParser._parse_many_io_uring(manifest_paths, use_cache)
+        
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda path: JSONParser.parse_plugin_manifest(path, use_cache), manifest_paths)
+            return dict(zip(manifest_paths, results))
+    
+    @staticmethod
+    def _parse_many_io_uring(paths: List[Path], use_cache: bool) -> Dict[Path, Optional[Dict[str, Any]]]:
+        """Read uncached manifests in io_uring batches, then parse them in turn"""
+        cache = _manifest_cache() if use_cache else None
+        results: Dict[Path, Optional[Dict[str, Any]]] = {}
+        pending: List[Tuple[Path, Optional[os.stat_result]]] = []
+        for path in paths:
+            stat_result = None
+            if cache is not None:
+                try:
+                    stat_result = os.stat(path)
+                except OSError:
+                    pass
+                else:
+                    cached = cache.get(os.path.abspath(path), stat_result)
+                    if cached is not None:
+                        results[path] = cached
+                        continue
+            pending.append((path, stat_result))
+        
+        contents = read_many([path for path, _ in pending])
+        for (path, stat_result), data in zip(pending, contents):
+            if data is None:
+                # Missing or unreadable; report it the usual way
+                results[path] = JSONParser._parse_plugin_manifest(path)
+                continue
+            result = JSONParser._normalize_manifest(JSONParser.parse_bytes(data, path))
+            if result is not None and cache is not None and stat_result is not None:
+                cache.put(os.path.abspath(path), stat_result, result)
+            results[path] = result
+        
+        return {path: results[path] for path in paths}
+    
+    @staticmethod
+    def _parse_plugin_manifest(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Parse and normalize a plugin manifest without consulting the cache"""
+        return JSONParser._normalize_manifest(JSONParser.parse(file_path))
+    
+    @staticmethod
+    def _normalize_manifest(result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Map common manifest field name variations to standard names"""
+        if result:
+            # Known manifest schemas have a dedicated normalizer
+            for marker, (schema_keys, normalizer) in _SCHEMA_NORMALIZERS.items():
+                if marker in result and result.keys() <= schema_keys:
+                    return normalizer(result)
             
-            for field in desc_fields:
-                if field in result:
-                    normalized['description'] = result[field]
-                    break
+            # Pick the highest priority variation of each standard field
+            best: Dict[str, Tuple[int, Any]] = {}
+            for key, value in result.items():
+                mapped = _FIELD_MAP.get(key)
+                if mapped is not None:
+                    standard, rank = mapped
+                    if standard not in best or rank < best[standard][0]:
+                        best[standard] = (rank, value)
             
-            for field in category_fields:
-                if field in result:
-                    normalized['category'] = result[field]
-                    break
+            normalized = {standard: best[standard][1] for standard in _MANIFEST_FIELDS if standard in best}
             
             # Include any other fields
             for key, value in result.items():
-                if key not in normalized.values():
+                if key not in normalized:
                     normalized[key] = value
             
             return normalized
@@ -307,17 +543,77 @@ class JSONParser:
         return None
 
 
-def read_plugin_json(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+def _normalize_vst3(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a VST3 moduleinfo.json, whose vendor is under Factory Info"""
+    normalized = {}
+    if 'Name' in result:
+        normalized['name'] = result['Name']
+    if 'Version' in result:
+        normalized['version'] = result['Version']
+    factory_info = result['Factory Info']
+    if isinstance(factory_info, dict) and 'Vendor' in factory_info:
+        normalized['vendor'] = factory_info['Vendor']
+    normalized.update(result)
+    return normalized
+
+
+def _normalize_clap(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a clap.json, which already uses the standard field names"""
+    normalized = {field: result[field] for field in _MANIFEST_FIELDS if field in result}
+    normalized.update(result)
+    return normalized
+
+
+# Normalizers for known manifest schemas, keyed by a field that identifies
+# the schema. A normalizer is used only if every field belongs to its schema.
+_SCHEMA_NORMALIZERS = {
+    'Factory Info': (
+        frozenset({'Name', 'Version', 'Factory Info', 'Compatibility', 'Classes'}),
+        _normalize_vst3
+    ),
+    'id': (
+        frozenset({'id', 'name', 'vendor', 'url', 'manual_url', 'support_url',
+                   'version', 'description', 'features'}),
+        _normalize_clap
+    ),
+}
+
+
+# Version of the results stored in the manifest cache; bump it whenever a
+# change to the parsing would change them, so older cached results are dropped
+_CACHE_VERSION = 1
+
+_MANIFEST_CACHE = None
+_MANIFEST_CACHE_LOCK = threading.Lock()
+
+
+def _manifest_cache() -> MetadataCache:
+    """Get the process-wide manifest cache, opening it on first use"""
+    global _MANIFEST_CACHE
+    if _MANIFEST_CACHE is None:
+        # Locked so concurrent first calls from reader threads open it only once
+        with _MANIFEST_CACHE_LOCK:
+            if _MANIFEST_CACHE is None:
+                cache = MetadataCache('manifest_cache', version=_CACHE_VERSION)
+                cache.open()
+                # New entries are written once, when the interpreter exits
+                atexit.register(cache.close)
+                _MANIFEST_CACHE = cache
+    return _MANIFEST_CACHE
+
+
+def read_plugin_json(file_path: Union[str, Path], use_cache: bool = False) -> Optional[Dict[str, Any]]:
     """
     Convenience function to read plugin JSON files
     
     Args:
         file_path: Path to the JSON file
+        use_cache: Whether to use the manifest cache (default: off)
         
     Returns:
         Parsed JSON as dictionary, or None if parsing fails
     """
-    return JSONParser.parse_plugin_manifest(file_path)
+    return JSONParser.parse_plugin_manifest(file_path, use_cache)
 
 
 def test_json_parser():
@@ -333,6 +629,10 @@ def test_json_parser():
         # Multiple trailing commas
         ('{"items": [1, 2, 3,], "name": "Test",}', True),
         
+        # Nested trailing commas
+        ('[[1,],]', True),
+        ('{"features": [["Fx", "Delay",],], "sub": {"a": 1,},}', True),
+        
         # Single-line comments
         ('{"name": "Test", // This is a comment\n"version": "1.0"}', True),
         
@@ -0,0 +1,127 @@
+"""
+Metadata Cache
+Persistent cache of parsed plugin metadata keyed by file path, modification
+time and size, so repeat scans only re-parse files that have changed.
+"""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+
+def default_cache_dir() -> Path:
+    """Get the directory used for cache databases"""
+    base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(base) / 'preset_manager'
+
+
+class MetadataCache:
+    """
+    SQLite-backed cache of metadata dictionaries
+
+    Entries are loaded once when the cache is opened and new entries are
+    written in a single transaction when it is closed. No connection is held
+    in between, so the cache can be opened, used and closed on different
+    threads. Use as a context manager:
+
+        with MetadataCache('vst_cache', version=1) as cache:
+            metadata = cache.get(path, os.stat(path))
+
+    Entries written with a different version are ignored and deleted on
+    close, so bumping the version when the parser changes drops stale
+    results.
+    """
+
+    def __init__(self, name: str, cache_dir: Optional[Union[str, Path]] = None, version: int = 0):
+        self.db_path = Path(cache_dir or default_cache_dir()) / f"{name}.db"
+        self.version = int(version)
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._pending: List[Tuple[str, int, int, str]] = []
+        self._available = False
+        self._stale = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connect to the database, creating the table if needed"""
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS metadata ('
+                'path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, metadata_json TEXT)'
+            )
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def open(self):
+        """Load all entries from the database"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            try:
+                # The version is kept in SQLite's user_version header field
+                self._stale = conn.execute('PRAGMA user_version').fetchone()[0] != self.version
+                if not self._stale:
+                    for path, mtime_ns, size, metadata_json in conn.execute('SELECT * FROM metadata'):
+                        self._entries[path] = (mtime_ns, size, metadata_json)
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Metadata cache unavailable ({self.db_path}): {e}")
+            return
+        self._available = True
+
+    def close(self):
+        """Write pending entries to the database"""
+        pending, self._pending = self._pending, []
+        if not self._available or not (pending or self._stale):
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    if self._stale:
+                        # Written by another version; replace it all
+                        conn.execute('DELETE FROM metadata')
+                        conn.execute(f'PRAGMA user_version = {self.version}')
+                    conn.executemany('INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)', pending)
+            finally:
+                conn.close()
+            self._stale = False
+        except sqlite3.Error as e:
+            print(f"Could not write metadata cache ({self.db_path}): {e}")
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, path: str, stat_result: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Get cached metadata for a file
+
+        Args:
+            path: File path used as the cache key
+            stat_result: Current stat of the file
+
+        Returns:
+            Cached metadata, or None if missing or the file has changed
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        mtime_ns, size, metadata_json = entry
+        if mtime_ns != stat_result.st_mtime_ns or size != stat_result.st_size:
+            return None
+        return json.loads(metadata_json)
+
+    def put(self, path: str, stat_result: os.stat_result, metadata: Dict[str, Any]):
+        """Store metadata for a file; written to disk when the cache is closed"""
+        metadata_json = json.dumps(metadata, default=str)
+        entry = (stat_result.st_mtime_ns, stat_result.st_size, metadata_json)
+        self._entries[path] = entry
+        self._pending.append((path,) + entry)
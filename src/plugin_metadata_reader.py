@@ -3,18 +3,28 @@ Plugin Metadata Reader
 A cross-platform Python module for reading metadata from VST, VST3, AU, and CLAP audio plugins.
 """
 
+import atexit
 import os
 import sys
 import struct
 import platform
 import json
 import plistlib
+import binascii
+import copy
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union, Any
+from dataclasses import dataclass
 from enum import Enum
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from metadata_cache import MetadataCache
+except ImportError:
+    from .metadata_cache import MetadataCache
 
 # Try to import our JSON utilities for better parsing
 try:
@@ -38,6 +48,35 @@ except ImportError:
     except ImportError:
         HAS_VST3_FIXER = False
 
+# Use orjson for faster parsing and export if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Operating system, looked up once rather than by every reader
+_SYSTEM = platform.system()
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Characters that separate path components on this system
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+
+# Magic number at the start of binary plists
+_BPLIST_MAGIC = b"bplist00"
+
+# Token scanner for the built-in lenient JSON fallback. Keeps strings
+# (group 1) and drops // and /* */ comments and commas before } or ],
+# including commas with only comments before the bracket
+_RE_LENIENT_CLEANER = re.compile(
+    r'("(?:[^"\\]|\\.)*")'
+    r'|//[^\n]*'
+    r'|/\*.*?\*/'
+    r'|,(?=(?:\s|//[^\n]*|/\*.*?\*/)*[}\]])',
+    re.DOTALL
+)
+
 
 class PluginFormat(Enum):
     """Supported plugin formats"""
@@ -56,7 +95,24 @@ class PluginType(Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+# Bundle/binary extensions for each plugin format, in scan order. Windows
+# .dll files can be VST or CLAP and are handled separately
+_FMT_TO_EXTS = {
+    PluginFormat.VST: (".vst",),
+    PluginFormat.VST3: (".vst3",),
+    PluginFormat.AU: (".component",),
+    PluginFormat.CLAP: (".clap",),
+}
+
+# Plugin format for each extension in _FMT_TO_EXTS
+_EXT_TO_FMT = {ext: fmt for fmt, exts in _FMT_TO_EXTS.items() for ext in exts}
+
+
+# Slotted dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PluginMetadata:
     """Container for plugin metadata"""
     name: str
@@ -75,31 +131,180 @@ class PluginMetadata:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary representation"""
-        result = asdict(self)
-        result['format'] = self.format.value
-        if self.plugin_type:
-            result['plugin_type'] = self.plugin_type.value
+        # Built by hand; asdict() recursively copies every field. The
+        # containers are still copied so the result can be changed freely
+        return {
+            'name': self.name,
+            'format': self.format.value,
+            'path': self.path,
+            'version': self.version,
+            'manufacturer': self.manufacturer,
+            'unique_id': self.unique_id,
+            'plugin_type': self.plugin_type.value if self.plugin_type else None,
+            'category': self.category,
+            'description': self.description,
+            'is_64bit': self.is_64bit,
+            'bundle_id': self.bundle_id,
+            'supported_architectures': (
+                list(self.supported_architectures) if self.supported_architectures is not None else None
+            ),
+            'additional_info': (
+                copy.deepcopy(self.additional_info) if self.additional_info is not None else None
+            ),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PluginMetadata':
+        """Create metadata from its to_dict() representation"""
+        data = dict(data)
+        data['format'] = PluginFormat(data['format'])
+        # Copy the containers, as to_dict does, so data can be reused freely
+        if data.get('supported_architectures') is not None:
+            data['supported_architectures'] = list(data['supported_architectures'])
+        if data.get('additional_info') is not None:
+            data['additional_info'] = copy.deepcopy(data['additional_info'])
+        if data.get('plugin_type'):
+            data['plugin_type'] = PluginType(data['plugin_type'])
+        return cls(**data)
+
+
+def _plist_value(element: ET.Element) -> Any:
+    """Convert an XML plist element to a Python value, or raise ValueError"""
+    tag = element.tag
+    if tag == "string":
+        return element.text or ""
+    if tag == "dict":
+        result = {}
+        children = iter(element)
+        for key in children:
+            value = next(children, None)
+            if key.tag != "key" or value is None:
+                raise ValueError("malformed plist dict")
+            result[key.text or ""] = _plist_value(value)
         return result
+    if tag == "array":
+        return [_plist_value(child) for child in element]
+    if tag == "integer":
+        raw = element.text or ""
+        if raw.startswith("0x") or raw.startswith("0X"):
+            return int(raw, 16)
+        return int(raw)
+    if tag == "true":
+        return True
+    if tag == "false":
+        return False
+    if tag == "real":
+        return float(element.text or "")
+    if tag == "data":
+        return binascii.a2b_base64((element.text or "").encode("ascii"))
+    raise ValueError(f"unsupported plist element: {tag}")  # e.g. <date>
+
+
+def _loads_plist(data: bytes) -> Any:
+    """
+    Parse plist data, building XML plists with ElementTree
+    
+    ElementTree builds the whole tree in C, which is several times faster
+    than plistlib's per-element Python callbacks. Binary plists, and XML
+    plists using anything the fast path doesn't handle, go to plistlib.
+    """
+    if data.startswith(_BPLIST_MAGIC):
+        return plistlib.loads(data, fmt=plistlib.FMT_BINARY)
+    # plistlib refuses entity declarations; let it report them
+    if b"<!ENTITY" not in data:
+        try:
+            root = ET.fromstring(data)
+            if root.tag == "plist" and len(root) == 1:
+                return _plist_value(root[0])
+        except (ET.ParseError, ValueError, UnicodeError):
+            pass
+    return plistlib.loads(data)
+
+
+def _strip_trailing_separators(plugin_path: str) -> str:
+    """Drop trailing path separators, e.g. from a shell-completed bundle path"""
+    return plugin_path.rstrip(_PATH_SEPARATORS) or plugin_path
+
+
+def _plugin_name(plugin_path: str) -> str:
+    """Get a plugin's name from its file or bundle path"""
+    return os.path.splitext(os.path.basename(plugin_path))[0]
+
+
+class _ParseCache:
+    """
+    Parsed plist/JSON files keyed by (absolute path, mtime_ns, size)
+    
+    A changed file gets a new key, so stale entries are never returned.
+    Once full, the oldest entries are evicted first.
+    """
+    
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, int, int], Dict] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(path: str, stat_result: os.stat_result) -> Tuple[str, int, int]:
+        """Build the cache key for a file from its current stat"""
+        return (os.path.abspath(path), stat_result.st_mtime_ns, stat_result.st_size)
+    
+    def get(self, key: Tuple[str, int, int]) -> Optional[Dict]:
+        # A copy, so a caller changing its result can't change later hits
+        value = self._entries.get(key)
+        return copy.copy(value) if value is not None else None
+    
+    def put(self, key: Tuple[str, int, int], value: Dict):
+        # Locked because scans run readers on several threads
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = value
+    
+    def clear(self):
+        self._entries.clear()
 
 
 class PluginMetadataReader:
     """Base class for plugin metadata readers"""
     
+    # Shared by all readers so rescans in the same process skip re-parsing
+    _parse_cache = _ParseCache()
+    
     def __init__(self):
-        self.system = platform.system()
+        self.system = _SYSTEM  # Kept for callers that read it
         
     def read(self, plugin_path: str) -> Optional[PluginMetadata]:
         """Read metadata from a plugin file or bundle"""
         raise NotImplementedError("Subclasses must implement read()")
     
     def _read_plist(self, plist_path: str) -> Optional[Dict]:
-        """Read a plist file (macOS)"""
+        """Read a plist file (macOS), or None if it doesn't exist"""
         try:
+            key = _ParseCache.key(plist_path, os.stat(plist_path))
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                return cached
             with open(plist_path, 'rb') as f:
-                return plistlib.load(f)
+                result = _loads_plist(f.read())
+        except (FileNotFoundError, NotADirectoryError):
+            return None  # Missing, or the plugin is a file rather than a bundle
         except Exception as e:
             print(f"Error reading plist {plist_path}: {e}")
             return None
+        self._parse_cache.put(key, result)
+        return result
+    
+    def _fill_from_plist(self, metadata: PluginMetadata, plist_data: Dict):
+        """Set bundle ID, version and manufacturer from a bundle's Info.plist"""
+        metadata.bundle_id = plist_data.get("CFBundleIdentifier")
+        metadata.version = plist_data.get("CFBundleVersion")
+        # Usually "Manufacturer, version, copyright"
+        info = plist_data.get("CFBundleGetInfoString")
+        if info:
+            comma = info.find(",")
+            metadata.manufacturer = (info[:comma] if comma >= 0 else info).strip()
     
     def _read_xml(self, xml_path: str) -> Optional[ET.Element]:
         """Read an XML file"""
@@ -111,7 +316,29 @@ class PluginMetadataReader:
             return None
     
     def _read_json_lenient(self, json_path: str) -> Optional[Dict]:
-        """Read a JSON file with lenient parsing (handles trailing commas, comments, etc.)"""
+        """
+        Read a JSON file with lenient parsing (handles trailing commas, comments, etc.)
+        
+        Returns None without reporting an error if the file doesn't exist
+        """
+        try:
+            key = _ParseCache.key(json_path, os.stat(json_path))
+        except (FileNotFoundError, NotADirectoryError):
+            return None  # Missing, or the plugin is a file rather than a bundle
+        except OSError:
+            key = None  # Let the parsers below report the error
+        else:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        result = self._parse_json_lenient(json_path)
+        if key is not None and result is not None:
+            self._parse_cache.put(key, result)
+        return result
+    
+    def _parse_json_lenient(self, json_path: str) -> Optional[Dict]:
+        """Parse a JSON file, trying each available lenient parser in turn"""
         # Use VST3-specific fixer for moduleinfo.json files
         if HAS_VST3_FIXER and "moduleinfo.json" in json_path:
             result = read_vst3_json(json_path)
@@ -126,40 +353,32 @@ class PluginMetadataReader:
         
         # Fallback to built-in lenient parser
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Remove trailing commas before } or ]
-            # This regex finds commas followed by optional whitespace and a closing brace/bracket
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
+            with open(json_path, 'rb') as f:
+                data = f.read()
             
-            # Remove C-style comments (// and /* */)
-            content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+            # Most manifests are valid JSON; parse the bytes directly and only
+            # decode and clean up the ones that aren't
+            try:
+                if HAS_ORJSON:
+                    return orjson.loads(data)
+                return json.loads(data)
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+                pass
+            content = data.decode('utf-8')
+            
+            # Remove C-style comments (// and /* */) and trailing commas in a
+            # single pass, leaving string contents alone
+            content = _RE_LENIENT_CLEANER.sub(r'\1', content)
             
             # Try to parse the cleaned JSON
             return json.loads(content)
         except json.JSONDecodeError as e:
-            # If it still fails, try more aggressive cleaning
-            try:
-                # Remove all trailing commas more aggressively
-                content = re.sub(r',(\s*[}\]])', r'\1', content)
-                # Remove any remaining comments
-                lines = content.split('\n')
-                cleaned_lines = []
-                for line in lines:
-                    if '//' in line:
-                        line = line[:line.index('//')]
-                    cleaned_lines.append(line)
-                content = '\n'.join(cleaned_lines)
-                return json.loads(content)
-            except:
-                # Suppress error messages for VST3 moduleinfo.json files since they're handled by VST3 fixer
-                if not (HAS_VST3_FIXER and "moduleinfo.json" in json_path):
-                    # Also suppress if we have json_utils
-                    if not HAS_JSON_UTILS:
-                        print(f"Error reading JSON {json_path}: {e}")
-                return None
+            # Suppress error messages for VST3 moduleinfo.json files since they're handled by VST3 fixer
+            if not (HAS_VST3_FIXER and "moduleinfo.json" in json_path):
+                # Also suppress if we have json_utils
+                if not HAS_JSON_UTILS:
+                    print(f"Error reading JSON {json_path}: {e}")
+            return None
         except Exception as e:
             # Suppress for VST3 files that are handled elsewhere
             if not (HAS_VST3_FIXER and "moduleinfo.json" in json_path):
@@ -173,62 +392,39 @@ class VST3Reader(PluginMetadataReader):
     
     def read(self, plugin_path: str) -> Optional[PluginMetadata]:
         """Read VST3 plugin metadata"""
-        path = Path(plugin_path)
+        plugin_path = _strip_trailing_separators(plugin_path)
         
-        if not path.exists():
+        if not os.path.exists(plugin_path):
             return None
             
         metadata = PluginMetadata(
-            name=path.stem,
+            name=_plugin_name(plugin_path),
             format=PluginFormat.VST3,
-            path=str(path)
+            path=plugin_path
         )
         
         # VST3 plugins are bundles on both macOS and Windows
-        if self.system == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
             # Read Info.plist
-            info_plist_path = path / "Contents" / "Info.plist"
-            if info_plist_path.exists():
-                plist_data = self._read_plist(str(info_plist_path))
-                if plist_data:
-                    metadata.bundle_id = plist_data.get("CFBundleIdentifier")
-                    metadata.version = plist_data.get("CFBundleVersion")
-                    metadata.manufacturer = plist_data.get("CFBundleGetInfoString", "").split(",")[0].strip() if plist_data.get("CFBundleGetInfoString") else None
+            plist_data = self._read_plist(os.path.join(plugin_path, "Contents", "Info.plist"))
+            if plist_data:
+                self._fill_from_plist(metadata, plist_data)
                     
             # Check for moduleinfo.json (VST3 SDK)
-            moduleinfo_path = path / "Contents" / "Resources" / "moduleinfo.json"
-            if moduleinfo_path.exists():
-                # Always use _read_json_lenient which now handles VST3 files properly
-                module_info = self._read_json_lenient(str(moduleinfo_path))
-                if module_info:
-                    metadata.name = module_info.get("Name", metadata.name)
-                    metadata.version = module_info.get("Version", metadata.version)
-                    # Handle nested Factory Info
-                    if "Factory Info" in module_info and isinstance(module_info["Factory Info"], dict):
-                        metadata.manufacturer = module_info["Factory Info"].get("Vendor", metadata.manufacturer)
-                    else:
-                        metadata.manufacturer = module_info.get("Vendor", metadata.manufacturer)
-                    metadata.category = module_info.get("Category")
-                    metadata.description = module_info.get("Description")
+            # Always use _read_json_lenient which now handles VST3 files properly
+            module_info = self._read_json_lenient(os.path.join(plugin_path, "Contents", "Resources", "moduleinfo.json"))
+            if module_info:
+                self._fill_from_moduleinfo(metadata, module_info)
                     
-        elif self.system == "Windows":
+        elif _IS_WINDOWS:
             # On Windows, check for Desktop.ini or moduleinfo.json
-            moduleinfo_path = path / "Contents" / "x86_64-win" / "moduleinfo.json"
-            if not moduleinfo_path.exists():
-                moduleinfo_path = path / "Contents" / "Resources" / "moduleinfo.json"
+            # Always use _read_json_lenient which now handles VST3 files properly
+            module_info = self._read_json_lenient(os.path.join(plugin_path, "Contents", "x86_64-win", "moduleinfo.json"))
+            if module_info is None:
+                module_info = self._read_json_lenient(os.path.join(plugin_path, "Contents", "Resources", "moduleinfo.json"))
                 
-            if moduleinfo_path.exists():
-                # Always use _read_json_lenient which now handles VST3 files properly
-                module_info = self._read_json_lenient(str(moduleinfo_path))
-                if module_info:
-                    metadata.name = module_info.get("Name", metadata.name)
-                    metadata.version = module_info.get("Version", metadata.version)
-                    # Handle nested Factory Info
-                    if "Factory Info" in module_info and isinstance(module_info["Factory Info"], dict):
-                        metadata.manufacturer = module_info["Factory Info"].get("Vendor", metadata.manufacturer)
-                    else:
-                        metadata.manufacturer = module_info.get("Vendor", metadata.manufacturer)
-                    metadata.category = module_info.get("Category")
+            if module_info:
+                self._fill_from_moduleinfo(metadata, module_info)
         
         # Determine plugin type from category or file structure
         if metadata.category:
@@ -238,6 +434,20 @@ class VST3Reader(PluginMetadataReader):
                 metadata.plugin_type = PluginType.EFFECT
                 
         return metadata
+    
+    def _fill_from_moduleinfo(self, metadata: PluginMetadata, module_info: Dict):
+        """Set name, version, vendor, category and description from moduleinfo.json"""
+        get = module_info.get
+        metadata.name = get("Name", metadata.name)
+        metadata.version = get("Version", metadata.version)
+        # Handle nested Factory Info
+        factory_info = get("Factory Info")
+        if isinstance(factory_info, dict):
+            metadata.manufacturer = factory_info.get("Vendor", metadata.manufacturer)
+        else:
+            metadata.manufacturer = get("Vendor", metadata.manufacturer)
+        metadata.category = get("Category")
+        metadata.description = get("Description")
 
 
 class VSTReader(PluginMetadataReader):
@@ -245,33 +455,29 @@ class VSTReader(PluginMetadataReader):
     
     def read(self, plugin_path: str) -> Optional[PluginMetadata]:
         """Read VST2 plugin metadata"""
-        path = Path(plugin_path)
+        plugin_path = _strip_trailing_separators(plugin_path)
         
-        if not path.exists():
+        if not os.path.exists(plugin_path):
             return None
             
         metadata = PluginMetadata(
-            name=path.stem,
+            name=_plugin_name(plugin_path),
             format=PluginFormat.VST,
-            path=str(path)
+            path=plugin_path
         )
         
-        if self.system == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
             # VST2 on macOS is usually a bundle
-            if path.suffix == ".vst":
-                info_plist_path = path / "Contents" / "Info.plist"
-                if info_plist_path.exists():
-                    plist_data = self._read_plist(str(info_plist_path))
-                    if plist_data:
-                        metadata.bundle_id = plist_data.get("CFBundleIdentifier")
-                        metadata.version = plist_data.get("CFBundleVersion")
-                        metadata.manufacturer = plist_data.get("CFBundleGetInfoString", "").split(",")[0].strip() if plist_data.get("CFBundleGetInfoString") else None
+            if os.path.splitext(plugin_path)[1] == ".vst":
+                plist_data = self._read_plist(os.path.join(plugin_path, "Contents", "Info.plist"))
+                if plist_data:
+                    self._fill_from_plist(metadata, plist_data)
                         
-        elif self.system == "Windows":
+        elif _IS_WINDOWS:
             # VST2 on Windows is a DLL
             # Reading DLL metadata requires parsing PE headers
             # This is a simplified version - for full metadata, you'd need to parse the DLL
-            metadata.is_64bit = "x64" in str(path) or "64" in str(path)
+            metadata.is_64bit = "x64" in plugin_path or "64" in plugin_path
             
         return metadata
 
@@ -281,55 +487,51 @@ class AUReader(PluginMetadataReader):
     
     def read(self, plugin_path: str) -> Optional[PluginMetadata]:
         """Read AU plugin metadata"""
-        if self.system != "Darwin":
+        if not _IS_DARWIN:
             print("Audio Units are only supported on macOS")
             return None
             
-        path = Path(plugin_path)
+        plugin_path = _strip_trailing_separators(plugin_path)
         
-        if not path.exists():
+        if not os.path.exists(plugin_path):
             return None
             
         metadata = PluginMetadata(
-            name=path.stem,
+            name=_plugin_name(plugin_path),
             format=PluginFormat.AU,
-            path=str(path)
+            path=plugin_path
         )
         
         # AU plugins are bundles with .component extension
-        info_plist_path = path / "Contents" / "Info.plist"
-        if info_plist_path.exists():
-            plist_data = self._read_plist(str(info_plist_path))
-            if plist_data:
-                metadata.bundle_id = plist_data.get("CFBundleIdentifier")
-                metadata.version = plist_data.get("CFBundleVersion")
-                metadata.manufacturer = plist_data.get("CFBundleGetInfoString", "").split(",")[0].strip() if plist_data.get("CFBundleGetInfoString") else None
+        plist_data = self._read_plist(os.path.join(plugin_path, "Contents", "Info.plist"))
+        if plist_data:
+            self._fill_from_plist(metadata, plist_data)
+            
+            # Get AU specific info
+            audio_components = plist_data.get("AudioComponents")
+            if audio_components and len(audio_components) > 0:
+                component = audio_components[0]
+                metadata.name = component.get("name", metadata.name)
+                metadata.manufacturer = component.get("manufacturer", metadata.manufacturer)
+                metadata.description = component.get("description")
+                
+                # Determine type from AU type code
+                type_code = component.get("type")
+                if type_code:
+                    if type_code in ["aumu", "aumf"]:  # Music Device, MIDI-controlled Effect
+                        metadata.plugin_type = PluginType.INSTRUMENT
+                    elif type_code == "aumx":  # Mixer
+                        metadata.plugin_type = PluginType.EFFECT
+                        metadata.category = "Mixer"
+                    elif type_code == "aufx":  # Effect
+                        metadata.plugin_type = PluginType.EFFECT
+                    elif type_code == "aumi":  # MIDI Processor
+                        metadata.plugin_type = PluginType.MIDI_EFFECT
+                        
+            # Get supported architectures
+            if "CFBundleSupportedPlatforms" in plist_data:
+                metadata.supported_architectures = list(plist_data["CFBundleSupportedPlatforms"])
                 
-                # Get AU specific info
-                audio_components = plist_data.get("AudioComponents")
-                if audio_components and len(audio_components) > 0:
-                    component = audio_components[0]
-                    metadata.name = component.get("name", metadata.name)
-                    metadata.manufacturer = component.get("manufacturer", metadata.manufacturer)
-                    metadata.description = component.get("description")
-                    
-                    # Determine type from AU type code
-                    type_code = component.get("type")
-                    if type_code:
-                        if type_code in ["aumu", "aumf"]:  # Music Device, MIDI-controlled Effect
-                            metadata.plugin_type = PluginType.INSTRUMENT
-                        elif type_code == "aumx":  # Mixer
-                            metadata.plugin_type = PluginType.EFFECT
-                            metadata.category = "Mixer"
-                        elif type_code == "aufx":  # Effect
-                            metadata.plugin_type = PluginType.EFFECT
-                        elif type_code == "aumi":  # MIDI Processor
-                            metadata.plugin_type = PluginType.MIDI_EFFECT
-                            
-                # Get supported architectures
-                if "CFBundleSupportedPlatforms" in plist_data:
-                    metadata.supported_architectures = plist_data["CFBundleSupportedPlatforms"]
-                    
         return metadata
 
 
@@ -338,70 +540,177 @@ class CLAPReader(PluginMetadataReader):
     
     def read(self, plugin_path: str) -> Optional[PluginMetadata]:
         """Read CLAP plugin metadata"""
-        path = Path(plugin_path)
+        plugin_path = _strip_trailing_separators(plugin_path)
         
-        if not path.exists():
+        if not os.path.exists(plugin_path):
             return None
             
         metadata = PluginMetadata(
-            name=path.stem,
+            name=_plugin_name(plugin_path),
             format=PluginFormat.CLAP,
-            path=str(path)
+            path=plugin_path
         )
         
         # CLAP plugins can have a descriptor file
-        if self.system == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
             # CLAP on macOS might be a bundle
-            if path.is_dir():
-                info_plist_path = path / "Contents" / "Info.plist"
-                if info_plist_path.exists():
-                    plist_data = self._read_plist(str(info_plist_path))
-                    if plist_data:
-                        metadata.bundle_id = plist_data.get("CFBundleIdentifier")
-                        metadata.version = plist_data.get("CFBundleVersion")
+            if os.path.isdir(plugin_path):
+                plist_data = self._read_plist(os.path.join(plugin_path, "Contents", "Info.plist"))
+                if plist_data:
+                    self._fill_from_plist(metadata, plist_data)
                         
                 # Look for CLAP manifest
-                manifest_path = path / "Contents" / "Resources" / "clap.json"
-                if manifest_path.exists():
-                    manifest = self._read_json_lenient(str(manifest_path))
-                    if manifest:
-                        metadata.name = manifest.get("name", metadata.name)
-                        metadata.version = manifest.get("version", metadata.version)
-                        metadata.manufacturer = manifest.get("vendor")
-                        metadata.description = manifest.get("description")
-                        metadata.unique_id = manifest.get("id")
-                        
-        elif self.system == "Windows":
-            # CLAP on Windows is typically a DLL
-            # Check for accompanying manifest file
-            manifest_path = path.with_suffix(".json")
-            if manifest_path.exists():
-                manifest = self._read_json_lenient(str(manifest_path))
+                manifest = self._read_json_lenient(os.path.join(plugin_path, "Contents", "Resources", "clap.json"))
                 if manifest:
                     metadata.name = manifest.get("name", metadata.name)
                     metadata.version = manifest.get("version", metadata.version)
                     metadata.manufacturer = manifest.get("vendor")
+                    metadata.description = manifest.get("description")
+                    metadata.unique_id = manifest.get("id")
+                        
+        elif _IS_WINDOWS:
+            # CLAP on Windows is typically a DLL
+            # Check for accompanying manifest file
+            manifest = self._read_json_lenient(os.path.splitext(plugin_path)[0] + ".json")
+            if manifest:
+                metadata.name = manifest.get("name", metadata.name)
+                metadata.version = manifest.get("version", metadata.version)
+                metadata.manufacturer = manifest.get("vendor")
                     
         return metadata
 
 
+def _iter_plugin_entries(root: str, extensions: Set[str]) -> Iterator[str]:
+    """
+    Walk a directory tree with os.scandir, yielding plugin paths
+    
+    Matches in a directory are yielded before its subdirectories are
+    walked. Plugin bundles of any format are not descended into, since
+    they never contain other plugins, and neither are symlinked
+    directories. Errors listing the root propagate; unreadable
+    subdirectories are skipped.
+    
+    Args:
+        root: Directory to walk
+        extensions: Lowercase extensions to match, e.g. {".vst3", ".clap"}
+    """
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in extensions:
+                # Skips broken symlinks, like the glob-based scan did
+                if entry.is_dir() or entry.is_file():
+                    yield entry.path
+            elif ext not in _EXT_TO_FMT and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    
+    for subdir in subdirs:
+        try:
+            yield from _iter_plugin_entries(subdir, extensions)
+        except OSError:
+            continue
+
+
+# Files the readers parse on this system, as path components below the
+# bundle. Cached metadata is reused only while none of them has changed;
+# plugins with none of these files are never cached.
+if _IS_DARWIN:
+    _SOURCE_FILES = {
+        PluginFormat.VST: (("Contents", "Info.plist"),),
+        PluginFormat.VST3: (("Contents", "Info.plist"), ("Contents", "Resources", "moduleinfo.json")),
+        PluginFormat.AU: (("Contents", "Info.plist"),),
+        PluginFormat.CLAP: (("Contents", "Info.plist"), ("Contents", "Resources", "clap.json")),
+    }
+elif _IS_WINDOWS:
+    _SOURCE_FILES = {
+        PluginFormat.VST3: (("Contents", "x86_64-win", "moduleinfo.json"), ("Contents", "Resources", "moduleinfo.json")),
+    }
+else:
+    _SOURCE_FILES = {}  # The readers parse no files here
+
+
+class _Fingerprint(NamedTuple):
+    """The stats of a plugin's source files, folded into what MetadataCache compares"""
+    st_mtime_ns: int
+    st_size: int
+
+
+def _source_fingerprint(plugin_path: str, format_type: PluginFormat) -> Optional[_Fingerprint]:
+    """Fingerprint the files a reader parses for a plugin, or None if there are none"""
+    stats = []
+    for parts in _SOURCE_FILES.get(format_type, ()):
+        try:
+            stat_result = os.stat(os.path.join(plugin_path, *parts))
+        except OSError:
+            stats.append((-1, -1))  # Missing; the fingerprint changes if it appears
+        else:
+            stats.append((stat_result.st_mtime_ns, stat_result.st_size))
+    sizes = [size for _, size in stats if size >= 0]
+    if not sizes:
+        return None
+    # Hashing a tuple of ints gives the same value in every process
+    return _Fingerprint(hash(tuple(stats)), sum(sizes))
+
+
+# Version of the metadata stored in the plugin cache; bump it whenever a
+# change to the readers would change it, so older cached metadata is dropped
+_CACHE_VERSION = 1
+
+_PLUGIN_CACHE = None
+_PLUGIN_CACHE_LOCK = threading.Lock()
+
+
+def _plugin_cache() -> MetadataCache:
+    """Get the process-wide plugin metadata cache, opening it on first use"""
+    global _PLUGIN_CACHE
+    if _PLUGIN_CACHE is None:
+        # Locked so concurrent first calls from scan threads open it only once
+        with _PLUGIN_CACHE_LOCK:
+            if _PLUGIN_CACHE is None:
+                cache = MetadataCache('plugin_cache', version=_CACHE_VERSION)
+                cache.open()
+                # New entries are written once, when the interpreter exits
+                atexit.register(cache.close)
+                _PLUGIN_CACHE = cache
+    return _PLUGIN_CACHE
+
+
 class PluginScanner:
     """Main class for scanning and reading plugin metadata"""
     
-    def __init__(self):
-        self.system = platform.system()
+    def __init__(self, use_cache: bool = False):
+        """
+        Args:
+            use_cache: Whether to keep metadata for bundles in the persistent
+                plugin cache, so unchanged bundles are not re-read next run
+                (default: off)
+        """
+        self.system = _SYSTEM  # Kept for callers that read it
+        self.use_cache = use_cache
         self.readers = {
             PluginFormat.VST: VSTReader(),
             PluginFormat.VST3: VST3Reader(),
-            PluginFormat.AU: AUReader() if self.system == "Darwin" else None,
+            PluginFormat.AU: AUReader() if _IS_DARWIN else None,
             PluginFormat.CLAP: CLAPReader()
         }
+        self._default_paths: Optional[Dict[PluginFormat, List[str]]] = None
+        if use_cache:
+            _plugin_cache()  # Open it here rather than on a scan thread
         
     def get_default_plugin_paths(self) -> Dict[PluginFormat, List[str]]:
-        """Get default plugin installation paths for the current OS"""
+        """
+        Get default plugin installation paths for the current OS
+        
+        The paths are built on the first call and the same dict is returned
+        afterwards, so don't modify it.
+        """
+        if self._default_paths is not None:
+            return self._default_paths
+        
         paths = {}
         
-        if self.system == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
             home = Path.home()
             paths[PluginFormat.VST] = [
                 str(home / "Library/Audio/Plug-Ins/VST"),
@@ -420,7 +729,7 @@ class PluginScanner:
                 "/Library/Audio/Plug-Ins/CLAP"
             ]
             
-        elif self.system == "Windows":
+        elif _IS_WINDOWS:
             paths[PluginFormat.VST] = [
                 "C:\\Program Files\\VSTPlugins",
                 "C:\\Program Files\\Steinberg\\VSTPlugins",
@@ -436,7 +745,7 @@ class PluginScanner:
                 "C:\\Program Files (x86)\\Common Files\\CLAP"
             ]
             
-        elif self.system == "Linux":
+        elif _SYSTEM == "Linux":
             home = Path.home()
             paths[PluginFormat.VST] = [
                 str(home / ".vst"),
@@ -454,31 +763,32 @@ class PluginScanner:
                 "/usr/local/lib/clap"
             ]
             
+        self._default_paths = paths
         return paths
     
     def detect_format(self, plugin_path: str) -> PluginFormat:
         """Detect plugin format from file extension"""
-        path = Path(plugin_path)
-        suffix = path.suffix.lower()
+        plugin_path = _strip_trailing_separators(plugin_path)
+        suffix = os.path.splitext(plugin_path)[1].lower()
         
-        if suffix == ".vst3":
-            return PluginFormat.VST3
-        elif suffix == ".vst":
-            return PluginFormat.VST
-        elif suffix == ".component":
-            return PluginFormat.AU
-        elif suffix == ".clap":
-            return PluginFormat.CLAP
-        elif suffix == ".dll" and self.system == "Windows":
+        format_type = _EXT_TO_FMT.get(suffix)
+        if format_type is not None:
+            return format_type
+        elif suffix == ".dll" and _IS_WINDOWS:
             # Could be VST2 or CLAP
-            if "vst" in path.stem.lower():
+            name = _plugin_name(plugin_path).lower()
+            if "vst" in name:
                 return PluginFormat.VST
-            elif "clap" in path.stem.lower():
+            elif "clap" in name:
                 return PluginFormat.CLAP
             return PluginFormat.VST  # Default to VST for DLLs
         else:
             return PluginFormat.UNKNOWN
             
+    def clear_cache(self):
+        """Forget plist and JSON files parsed by earlier scans"""
+        PluginMetadataReader._parse_cache.clear()
+    
     def read_plugin(self, plugin_path: str) -> Optional[PluginMetadata]:
         """Read metadata from a single plugin"""
         format_type = self.detect_format(plugin_path)
@@ -491,58 +801,110 @@ class PluginScanner:
         if reader is None:
             print(f"No reader available for format: {format_type}")
             return None
-            
-        return reader.read(plugin_path)
+        
+        if not self.use_cache:
+            return reader.read(plugin_path)
+        
+        # Bundles are cached against every file their reader parses, so a
+        # changed or repaired manifest is read again
+        plugin_path = _strip_trailing_separators(plugin_path)
+        fingerprint = _source_fingerprint(plugin_path, format_type)
+        if fingerprint is None:
+            return reader.read(plugin_path)  # Nothing parsed, nothing to cache
+        
+        cache = _plugin_cache()
+        cache_key = os.path.abspath(plugin_path)
+        cached = cache.get(cache_key, fingerprint)
+        if cached is not None:
+            cached['path'] = plugin_path
+            return PluginMetadata.from_dict(cached)
+        
+        metadata = reader.read(plugin_path)
+        if metadata:
+            cache.put(cache_key, fingerprint, metadata.to_dict())
+        return metadata
     
     def scan_directory(self, directory: str, format_filter: Optional[PluginFormat] = None) -> List[PluginMetadata]:
         """Scan a directory for plugins"""
-        results = []
-        path = Path(directory)
-        
-        if not path.exists():
+        try:
+            return self._scan_directory(directory, format_filter)
+        except FileNotFoundError:
             print(f"Directory does not exist: {directory}")
-            return results
-            
+            return []
+    
+    def _scan_directory(self, directory: str, format_filter: Optional[PluginFormat]) -> List[PluginMetadata]:
+        """Scan a directory for plugins, raising FileNotFoundError if it is missing"""
+        all_metadata = self._read_plugins(self._find_plugins(directory, format_filter))
+        return [metadata for metadata in all_metadata if metadata]
+    
+    def _find_plugins(self, directory: str, format_filter: Optional[PluginFormat]) -> List[str]:
+        """List the plugins in a directory, raising FileNotFoundError if it is missing"""
         # Define extensions to look for
-        extensions = []
         if format_filter:
-            if format_filter == PluginFormat.VST:
-                extensions = [".vst", ".dll"] if self.system == "Windows" else [".vst"]
-            elif format_filter == PluginFormat.VST3:
-                extensions = [".vst3"]
-            elif format_filter == PluginFormat.AU:
-                extensions = [".component"]
-            elif format_filter == PluginFormat.CLAP:
-                extensions = [".clap", ".dll"] if self.system == "Windows" else [".clap"]
+            extensions = list(_FMT_TO_EXTS.get(format_filter, ()))
+            if _IS_WINDOWS and format_filter in (PluginFormat.VST, PluginFormat.CLAP):
+                extensions.append(".dll")
         else:
             # Look for all formats
-            extensions = [".vst", ".vst3", ".component", ".clap"]
-            if self.system == "Windows":
+            extensions = list(_EXT_TO_FMT)
+            if _IS_WINDOWS:
                 extensions.append(".dll")
-                
-        # Scan for plugins
-        for ext in extensions:
-            for plugin_path in path.glob(f"**/*{ext}"):
-                if plugin_path.is_dir() or plugin_path.is_file():
-                    metadata = self.read_plugin(str(plugin_path))
-                    if metadata:
-                        results.append(metadata)
-                        
-        return results
+        
+        # Walk the tree once for all extensions, keeping results grouped
+        # by extension in the order above
+        found = {ext: [] for ext in extensions}
+        try:
+            for plugin_path in _iter_plugin_entries(directory, set(extensions)):
+                found[os.path.splitext(plugin_path)[1].lower()].append(plugin_path)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            return []  # Not a directory, or not readable
+        
+        return [plugin_path for ext in extensions for plugin_path in found[ext]]
+    
+    def _read_plugins(self, plugin_paths: List[str]) -> List[Optional[PluginMetadata]]:
+        """Read several plugins, returning their metadata (or None) in the same order"""
+        # Overlap the plugins' file I/O on threads unless there are too few
+        # for a pool to pay off
+        if len(plugin_paths) > 8:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                return list(executor.map(self.read_plugin, plugin_paths))
+        return [self.read_plugin(plugin_path) for plugin_path in plugin_paths]
     
     def scan_default_locations(self) -> Dict[PluginFormat, List[PluginMetadata]]:
         """Scan all default plugin locations"""
-        results = {}
         default_paths = self.get_default_plugin_paths()
+        results = {format_type: [] for format_type in default_paths}
+        tasks = [
+            (format_type, path)
+            for format_type, paths in default_paths.items()
+            for path in paths
+        ]
+        if not tasks:
+            return results
+        
+        # Walk the locations concurrently; most of the time is spent in file
+        # system calls, which release the GIL
+        with ThreadPoolExecutor(max_workers=min(16, len(tasks))) as executor:
+            found = list(executor.map(lambda task: self._find_default_plugins(*task), tasks))
         
-        for format_type, paths in default_paths.items():
-            format_results = []
-            for path in paths:
-                if Path(path).exists():
-                    format_results.extend(self.scan_directory(path, format_type))
-            results[format_type] = format_results
+        # Then read every plugin found on a single pool, rather than one
+        # pool per location, and group the results in location order
+        formats = [format_type for (format_type, _), plugin_paths in zip(tasks, found) for _ in plugin_paths]
+        plugin_paths = [plugin_path for paths in found for plugin_path in paths]
+        for format_type, metadata in zip(formats, self._read_plugins(plugin_paths)):
+            if metadata:
+                results[format_type].append(metadata)
             
         return results
+    
+    def _find_default_plugins(self, format_type: PluginFormat, path: str) -> List[str]:
+        """List the plugins in one default location, treating a missing directory as empty"""
+        try:
+            return self._find_plugins(path, format_type)
+        except FileNotFoundError:
+            return []  # Not installed on this system
 
 
 def main():
@@ -578,8 +940,11 @@ def main():
             
     if all_metadata:
         output_file = "plugin_metadata.json"
-        with open(output_file, 'w') as f:
-            json.dump(all_metadata, f, indent=2)
+        if HAS_ORJSON:
+            Path(output_file).write_bytes(orjson.dumps(all_metadata, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(all_metadata, f, indent=2)
         print(f"\nMetadata exported to {output_file}")
 
 
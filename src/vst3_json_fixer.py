@@ -10,11 +10,136 @@ These files often have:
 - Spaces in JSON keys (which is valid but needs careful handling)
 """
 
+import atexit
 import json
+import os
 import re
-import codecs
+import string
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
+
+try:
+    from metadata_cache import MetadataCache
+except ImportError:
+    from .metadata_cache import MetadataCache
+
+# Try to import orjson for faster parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Try to import pcre2 for JIT-compiled regular expressions
+try:
+    import pcre2
+    HAS_PCRE2 = True
+except ImportError:
+    HAS_PCRE2 = False
+
+
+def _compile(pattern: str, flags: int = 0):
+    """
+    Compile a pattern with PCRE2's JIT if available, otherwise with re
+    
+    Args:
+        pattern: Pattern that means the same in both engines
+        flags: re.MULTILINE and/or re.DOTALL
+    """
+    if HAS_PCRE2:
+        pcre2_flags = (pcre2.MULTILINE if flags & re.MULTILINE else 0) | (pcre2.DOTALL if flags & re.DOTALL else 0)
+        return pcre2.compile(pattern, pcre2_flags)
+    return re.compile(pattern, flags)
+
+# The characters re's \s matches in str patterns, for use inside character
+# classes; spelled out because PCRE2's \s differs slightly
+_WHITESPACE = '\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+# // comments, except after ':' so URLs survive
+_LINE_COMMENT = _compile(r'(?<!:)//.*?$', re.MULTILINE)
+
+# /* */ comments
+_BLOCK_COMMENT = _compile(r'/\*.*?\*/', re.DOTALL)
+
+# A comma before a closing brace or bracket, possibly with more commas
+# in between
+_TRAILING_COMMA = _compile(',(?=[,' + _WHITESPACE + ']*[}\\]])')
+
+# A JSON string token, from its opening quote to the closing quote, or to the
+# end of the content if it is never closed; captured so split() keeps it
+_STRING_TOKEN = re.compile(r'("[^"\\]*(?:\\[\s\S][^"\\]*)*(?:"|\\?\Z))')
+
+# Content whose strings are all closed and free of control characters and
+# brackets, so no string needs fixing and every bracket is structural; each
+# branch starts with a different character, which keeps a failed match linear
+_PLAIN_STRINGS = re.compile(r'[^"]*(?:"[^"\\\x00-\x1f{}\[\]]*(?:\\[^{}\[\]][^"\\\x00-\x1f{}\[\]]*)*"[^"]*)*')
+
+# Control characters, which JSON doesn't allow unescaped inside strings
+_CONTROL_CHAR = re.compile(r'[\x00-\x1f]')
+
+# An escape sequence, left alone, or a control character to fix
+_ESCAPE_OR_CONTROL = re.compile(r'\\[\s\S]|[\x00-\x1f]')
+
+# Tab, newline and carriage return become escapes; other control characters are dropped
+_CONTROL_ESCAPES = {chr(i): '' for i in range(32)}
+_CONTROL_ESCAPES.update({'\t': '\\t', '\n': '\\n', '\r': '\\r'})
+_CONTROL_TABLE = str.maketrans(_CONTROL_ESCAPES)
+
+# Lone carriage returns become newlines and null bytes are dropped
+_EOL_TABLE = str.maketrans({'\r': '\n', '\x00': ''})
+
+# ASCII characters outside string.printable, deleted by the last-resort parse;
+# anything beyond ASCII is dropped by encoding first
+_NON_PRINTABLE_TABLE = dict.fromkeys(i for i in range(128) if chr(i) not in string.printable)
+
+
+def _fix_control_char(match: re.Match) -> str:
+    """Keep an escape sequence, or escape or drop a control character"""
+    text = match.group(0)
+    return text if len(text) == 2 else _CONTROL_ESCAPES[text]
+
+
+def _fix_string_token(token: str) -> str:
+    """Escape or drop the control characters in one JSON string token"""
+    if _CONTROL_CHAR.search(token) is None:
+        return token
+    if '\\' not in token:
+        return token.translate(_CONTROL_TABLE)
+    # Characters after a backslash belong to the escape and are kept as-is
+    return _ESCAPE_OR_CONTROL.sub(_fix_control_char, token)
+
+
+def _fix_strings(content: str) -> Tuple[str, str]:
+    """
+    Fix the control characters in every string token
+    
+    Args:
+        content: JSON string with potential control characters
+        
+    Returns:
+        The fixed content, and text whose brackets are the structural ones
+    """
+    # A single scan with no per-string work for well-formed files
+    if _PLAIN_STRINGS.fullmatch(content):
+        return content, content
+    
+    # Odd pieces are string tokens, even pieces the text between them.
+    # Control characters between tokens are whitespace and stay as they are.
+    pieces = _STRING_TOKEN.split(content)
+    structure = ''.join(pieces[0::2])
+    pieces[1::2] = [_fix_string_token(token) for token in pieces[1::2]]
+    return ''.join(pieces), structure
+
+
+def _loads(content: str) -> Any:
+    """Parse JSON text with orjson if available, otherwise with json"""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # json also accepts NaN, Infinity and very large integers
+    return json.loads(content)
 
 
 class VST3JSONFixer:
@@ -31,36 +156,16 @@ class VST3JSONFixer:
         Returns:
             File content as string with normalized line endings
         """
-        file_path = Path(file_path)
-        
-        # Try different encodings in order of likelihood
-        encodings = ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        
-        content = None
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                break
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-        
-        if content is None:
-            # Last resort: read as binary and decode with replacement
-            with open(file_path, 'rb') as f:
-                raw_bytes = f.read()
-                # Remove BOM if present
-                if raw_bytes.startswith(codecs.BOM_UTF8):
-                    raw_bytes = raw_bytes[len(codecs.BOM_UTF8):]
-                content = raw_bytes.decode('utf-8', errors='replace')
-        
-        # Normalize line endings to \n
-        content = content.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Remove any null bytes
-        content = content.replace('\x00', '')
+        # Read once and decode in memory; utf-8-sig strips a BOM if present,
+        # and latin-1 accepts any bytes so nothing else needs trying
+        raw_bytes = Path(file_path).read_bytes()
+        try:
+            content = raw_bytes.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            content = raw_bytes.decode('latin-1')
         
-        return content
+        # Normalize line endings to \n and remove any null bytes
+        return content.replace('\r\n', '\n').translate(_EOL_TABLE)
     
     @staticmethod
     def remove_comments(content: str) -> str:
@@ -73,12 +178,16 @@ class VST3JSONFixer:
         Returns:
             JSON string without comments
         """
+        # Nothing to do, and no regex scans, for the usual comment-free file
+        if '//' not in content and '/*' not in content:
+            return content
+        
         # Remove single-line comments (// ...) but preserve URLs
         # Match // only if not preceded by : (for URLs)
-        content = re.sub(r'(?<!:)//.*?$', '', content, flags=re.MULTILINE)
+        content = _LINE_COMMENT.sub('', content)
         
         # Remove multi-line comments (/* ... */)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+        content = _BLOCK_COMMENT.sub('', content)
         
         return content
     
@@ -93,19 +202,9 @@ class VST3JSONFixer:
         Returns:
             JSON string without trailing commas
         """
-        # Keep removing trailing commas until no more are found
-        # This handles nested cases
-        prev_content = None
-        max_iterations = 10  # Prevent infinite loops
-        iterations = 0
-        
-        while prev_content != content and iterations < max_iterations:
-            prev_content = content
-            # Remove comma before closing brace or bracket, with optional whitespace
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
-            iterations += 1
-        
-        return content
+        # The lookahead skips over further commas, so runs like ",,]" are
+        # removed in the same pass
+        return _TRAILING_COMMA.sub('', content)
     
     @staticmethod
     def fix_control_characters(content: str) -> str:
@@ -118,65 +217,16 @@ class VST3JSONFixer:
         Returns:
             JSON string with fixed control characters
         """
-        # First, let's identify string boundaries properly
-        # We need to be careful not to modify control characters outside of string values
-        
-        # Split content into tokens (rough tokenization)
-        result = []
-        i = 0
-        while i < len(content):
-            if content[i] == '"':
-                # Start of a string
-                j = i + 1
-                string_chars = ['"']
-                
-                # Find the end of the string
-                while j < len(content):
-                    if content[j] == '\\' and j + 1 < len(content):
-                        # Escaped character - keep both the backslash and next char
-                        string_chars.append(content[j])
-                        string_chars.append(content[j + 1])
-                        j += 2
-                    elif content[j] == '"':
-                        # End of string
-                        string_chars.append('"')
-                        j += 1
-                        break
-                    else:
-                        # Regular character
-                        char = content[j]
-                        
-                        # Check if it's a control character that needs escaping
-                        if ord(char) < 32 and char not in '\n\r\t':
-                            # Skip invalid control characters
-                            j += 1
-                            continue
-                        elif char == '\t':
-                            string_chars.append('\\t')
-                        elif char == '\n':
-                            string_chars.append('\\n')
-                        elif char == '\r':
-                            string_chars.append('\\r')
-                        else:
-                            string_chars.append(char)
-                        j += 1
-                
-                result.append(''.join(string_chars))
-                i = j
-            else:
-                # Not in a string, keep as-is
-                result.append(content[i])
-                i += 1
-        
-        return ''.join(result)
+        return _fix_strings(content)[0]
     
     @staticmethod
-    def validate_and_fix_structure(content: str) -> str:
+    def validate_and_fix_structure(content: str, structure: Optional[str] = None) -> str:
         """
         Validate and fix JSON structure issues
         
         Args:
             content: JSON string to validate
+            structure: Content with string tokens removed, if already known
             
         Returns:
             Fixed JSON string
@@ -189,11 +239,13 @@ class VST3JSONFixer:
         if not content:
             return '{}'
         
-        # Check bracket balance
-        open_braces = content.count('{')
-        close_braces = content.count('}')
-        open_brackets = content.count('[')
-        close_brackets = content.count(']')
+        # Check bracket balance, ignoring brackets inside strings
+        if structure is None:
+            structure = _fix_strings(content)[1]
+        open_braces = structure.count('{')
+        close_braces = structure.count('}')
+        open_brackets = structure.count('[')
+        close_brackets = structure.count(']')
         
         # Add missing closing braces/brackets
         if open_braces > close_braces:
@@ -204,16 +256,40 @@ class VST3JSONFixer:
         return content
     
     @staticmethod
-    def parse(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    def parse(file_path: Union[str, Path], use_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Parse a VST3 moduleinfo.json file with all fixes applied
         
+        With use_cache, results are cached on disk by path, modification
+        time and size, so unchanged files are only parsed once.
+        
         Args:
             file_path: Path to the moduleinfo.json file
+            use_cache: Whether to use the moduleinfo cache (default: off)
             
         Returns:
             Parsed JSON as dictionary, or None if parsing fails
         """
+        if not use_cache:
+            return VST3JSONFixer._parse(file_path)
+        
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        
+        key = os.path.abspath(file_path)
+        cache = _moduleinfo_cache()
+        result = cache.get(key, stat_result)
+        if result is None:
+            result = VST3JSONFixer._parse(file_path)
+            if result is not None:
+                cache.put(key, stat_result, result)
+        return result
+    
+    @staticmethod
+    def _parse(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Parse a moduleinfo.json file without the cache"""
         file_path = Path(file_path)
         
         if not file_path.exists():
@@ -223,24 +299,29 @@ class VST3JSONFixer:
             # Read file with robust encoding handling
             content = VST3JSONFixer.read_file_robust(file_path)
             
+            # Most files are valid JSON already and need none of the fixes
+            try:
+                return _loads(content)
+            except json.JSONDecodeError:
+                pass
+            
             # Apply fixes in order
             content = VST3JSONFixer.remove_comments(content)
             content = VST3JSONFixer.fix_trailing_commas(content)
-            content = VST3JSONFixer.fix_control_characters(content)
-            content = VST3JSONFixer.validate_and_fix_structure(content)
+            # Fixing strings also finds the brackets outside them
+            content, structure = _fix_strings(content)
+            content = VST3JSONFixer.validate_and_fix_structure(content, structure)
             
             # Try to parse the fixed content
             try:
-                return json.loads(content)
+                return _loads(content)
             except json.JSONDecodeError as e:
                 # If it still fails, try one more aggressive approach
                 # Remove all non-printable characters except whitespace
-                import string
-                printable = set(string.printable)
-                content = ''.join(char for char in content if char in printable)
+                content = content.encode('ascii', 'ignore').decode('ascii').translate(_NON_PRINTABLE_TABLE)
                 
                 # Try again
-                return json.loads(content)
+                return _loads(content)
                 
         except Exception as e:
             # Silently fail for VST3 files - many don't have valid JSON anyway
@@ -287,17 +368,41 @@ class VST3JSONFixer:
         return metadata
 
 
-def read_vst3_json(file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+# Version of the results stored in the moduleinfo cache; bump it whenever a
+# change to the fixes would change them, so older cached results are dropped
+_CACHE_VERSION = 1
+
+_MODULEINFO_CACHE = None
+_MODULEINFO_CACHE_LOCK = threading.Lock()
+
+
+def _moduleinfo_cache() -> MetadataCache:
+    """Get the process-wide moduleinfo cache, opening it on first use"""
+    global _MODULEINFO_CACHE
+    if _MODULEINFO_CACHE is None:
+        # Locked so concurrent first calls from reader threads open it only once
+        with _MODULEINFO_CACHE_LOCK:
+            if _MODULEINFO_CACHE is None:
+                cache = MetadataCache('moduleinfo_cache', version=_CACHE_VERSION)
+                cache.open()
+                # New entries are written once, when the interpreter exits
+                atexit.register(cache.close)
+                _MODULEINFO_CACHE = cache
+    return _MODULEINFO_CACHE
+
+
+def read_vst3_json(file_path: Union[str, Path], use_cache: bool = False) -> Optional[Dict[str, Any]]:
     """
     Convenience function to read and parse VST3 moduleinfo.json files
     
     Args:
         file_path: Path to the moduleinfo.json file
+        use_cache: Whether to use the moduleinfo cache (default: off)
         
     Returns:
         Parsed JSON data or None if parsing fails
     """
-    return VST3JSONFixer.parse(file_path)
+    return VST3JSONFixer.parse(file_path, use_cache)
 
 
 def test_vst3_fixer():
@@ -4,8 +4,11 @@ Test script for CLAP plugin scanning
 Verifies that the improved JSON parsing handles malformed moduleinfo.json files
 """
 
+import os
 import sys
 import json
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src directory to path
@@ -42,8 +45,9 @@ def test_clap_scanning():
         print(f"\n✓ Scanning: {clap_dir}")
         print("-" * 40)
         
-        # Find all CLAP plugins
-        clap_files = list(clap_dir.glob("*.clap"))
+        # Find all CLAP plugins, as plain string paths
+        with os.scandir(clap_dir) as entries:
+            clap_files = [entry.path for entry in entries if entry.name.endswith(".clap")]
         
         if not clap_files:
             print("  No CLAP plugins found in this directory")
@@ -51,12 +55,13 @@ def test_clap_scanning():
             
         print(f"  Found {len(clap_files)} CLAP plugin(s)")
         
-        for clap_file in clap_files:
+        # Read the plugin metadata in parallel; results come back in order
+        with ThreadPoolExecutor(max_workers=min(32, len(clap_files))) as executor:
+            results = list(executor.map(scanner.read_plugin, clap_files))
+        
+        for clap_file, metadata in zip(clap_files, results):
             total_plugins += 1
-            print(f"\n  Plugin: {clap_file.name}")
-            
-            # Try to read the plugin metadata
-            metadata = scanner.read_plugin(str(clap_file))
+            print(f"\n  Plugin: {os.path.basename(clap_file)}")
             
             if metadata:
                 successful_reads += 1
@@ -71,13 +76,13 @@ def test_clap_scanning():
                     
                 # Check for moduleinfo.json
                 moduleinfo_paths = [
-                    clap_file / "Contents" / "Resources" / "moduleinfo.json",
-                    clap_file / "Contents" / "moduleinfo.json"
+                    os.path.join(clap_file, "Contents", "Resources", "moduleinfo.json"),
+                    os.path.join(clap_file, "Contents", "moduleinfo.json")
                 ]
                 
                 for moduleinfo_path in moduleinfo_paths:
-                    if moduleinfo_path.exists():
-                        print(f"    ℹ Found moduleinfo.json at: {moduleinfo_path.relative_to(clap_file)}")
+                    if os.path.isfile(moduleinfo_path):
+                        print(f"    ℹ Found moduleinfo.json at: {os.path.relpath(moduleinfo_path, clap_file)}")
                         
                         # Try to parse it directly
                         json_data = read_plugin_json(moduleinfo_path)
@@ -85,13 +90,13 @@ def test_clap_scanning():
                             print(f"      ✓ Successfully parsed JSON")
                         else:
                             print(f"      ✗ Failed to parse JSON")
-                            # Try to show what's wrong
+                            # Try to show what's wrong, reading no further than line 11
                             try:
-                                with open(moduleinfo_path, 'r') as f:
-                                    content = f.read()
-                                    lines = content.split('\n')
+                                with open(moduleinfo_path, 'r', errors='replace') as f:
+                                    lines = list(islice(f, 11))
                                     if len(lines) > 10:
-                                        print(f"      Line 11: {lines[10][:60]}...")
+                                        line = lines[10].rstrip('\n')
+                                        print(f"      Line 11: {line[:60]}...")
                             except:
                                 pass
                         break
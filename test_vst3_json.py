@@ -8,17 +8,66 @@ Handles common issues in VST3 metadata files including:
 - Mixed formatting
 """
 
+import codecs
+import os
 import sys
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from plugin_metadata_reader import PluginScanner, PluginFormat
 from json_utils import JSONParser, read_plugin_json
+from metadata_cache import MetadataCache
+
+# Use orjson for faster parsing of well-formed files if available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Use pyjson5 to parse comments and trailing commas natively if available
+try:
+    import pyjson5
+    HAS_PYJSON5 = True
+except ImportError:
+    HAS_PYJSON5 = False
+
+# A comma before a closing brace or bracket, possibly with more commas
+# in between
+_TRAILING_COMMA_RE = re.compile(r',(?=[\s,]*[}\]])')
+
+# // and /* */ comments
+_LINE_COMMENT_RE = re.compile(r'//.*?$', re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# A JSON string on a single line
+_STRING_RE = re.compile(r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"')
+
+# Decodes one JSON value and reports where it ended
+_DECODER = json.JSONDecoder()
+
+# System-wide and per-user VST3 plugin directories (macOS)
+_VST3_DIRS = (
+    Path("/Library/Audio/Plug-Ins/VST3"),
+    Path.home() / "Library/Audio/Plug-Ins/VST3",
+)
+
+# Where a bundle may keep its moduleinfo.json, in order of preference
+_MODULEINFO_SUBPATHS = (
+    os.path.join("Contents", "Resources", "moduleinfo.json"),
+    os.path.join("Contents", "moduleinfo.json"),
+)
+
+
+def _escape_string_controls(match: re.Match) -> str:
+    """Escape raw tabs and carriage returns inside one JSON string"""
+    return match.group(0).replace('\t', '\\t').replace('\r', '\\r')
 
 
 def fix_vst3_json(content: str) -> str:
@@ -32,157 +81,244 @@ def fix_vst3_json(content: str) -> str:
         Fixed JSON string
     """
     # Remove trailing commas before } or ]
-    # Multiple passes to handle nested cases
-    prev_content = None
-    while prev_content != content:
-        prev_content = content
-        content = re.sub(r',(\s*[}\]])', r'\1', content)
-    
-    # Remove C-style comments
-    content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-    content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-    
-    # Handle control characters in string values
-    # This is tricky because we need to preserve the JSON structure
-    lines = content.split('\n')
-    fixed_lines = []
-    
-    for line in lines:
-        # Check if line contains a string value
-        if '": "' in line or '":"' in line:
-            # Try to fix potential control character issues
-            # by ensuring proper escaping
-            line = line.replace('\t', '\\t')
-            line = line.replace('\r', '\\r')
-            # Don't replace \n as it's our line separator
-        fixed_lines.append(line)
-    
-    content = '\n'.join(fixed_lines)
-    
-    return content
+    # The lookahead skips over further commas, so ",,]" needs no second pass
+    content = _TRAILING_COMMA_RE.sub('', content)
+    
+    # Remove C-style comments; a substring check is far cheaper than a
+    # regex scan, and most files have none
+    if '//' in content:
+        content = _LINE_COMMENT_RE.sub('', content)
+    if '/*' in content:
+        content = _BLOCK_COMMENT_RE.sub('', content)
+    
+    # Nothing below changes content without tabs or carriage returns
+    if '\t' not in content and '\r' not in content:
+        return content
+    
+    # Handle control characters in string values. Only string tokens are
+    # rewritten, so tabs used for indentation stay valid whitespace.
+    return _STRING_RE.sub(_escape_string_controls, content)
+
 
+# Files parsed during this run, keyed by path, modification time and size.
+# Kept separate from the readers' parse cache so the PluginScanner pass in
+# main still checks the scanner's own parser.
+_PARSED: Dict[Tuple[str, int, int], Any] = {}
 
-def parse_vst3_json(file_path: Path) -> Optional[Dict[str, Any]]:
+
+def parse_vst3_json(file_path: Path, cache: Optional[MetadataCache] = None,
+                    report: Callable[[str], Any] = print) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
     """
     Parse a VST3 moduleinfo.json file with enhanced error handling
     
     Args:
         file_path: Path to the moduleinfo.json file
+        cache: Open cache of earlier results, keyed by path, modification
+            time and size
+        report: Called with each diagnostic message (default: print)
         
     Returns:
-        Parsed JSON data or None if parsing fails
+        Parsed JSON data or None if parsing fails, and the file contents
+        whenever the data is empty or missing, so callers can show them
+        without reading the file again
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"Error reading file {file_path}: {e}")
-        return None
-    
-    # Try standard JSON first
+        stat_result = os.stat(file_path)
+    except OSError:
+        return _parse_vst3_json(file_path, report)
+    
+    key = os.path.abspath(file_path)
+    memo_key = (key, stat_result.st_mtime_ns, stat_result.st_size)
+    data = _PARSED.get(memo_key)
+    if data is None and cache is not None:
+        data = cache.get(key, stat_result)
+    if data is not None:
+        return data, None
+    
+    data, raw = _parse_vst3_json(file_path, report)
+    
+    # Failures are parsed again so their diagnostics are shown each time
+    if data:
+        _PARSED[memo_key] = data
+        if cache is not None:
+            cache.put(key, stat_result, data)
+    return data, raw
+
+
+def _parse_vst3_json(file_path: Path, report: Callable[[str], Any]) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+    """Parse a moduleinfo.json file without the cache; also returns its contents"""
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
-        pass
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except Exception as e:
+        report(f"Error reading file {file_path}: {e}")
+        return None, None
+    
+    # Try standard JSON first, straight from the bytes. Content that does
+    # not start like an object or array (empty, binary, a leading comment)
+    # goes straight to repair.
+    if raw.lstrip()[:1] in (b'{', b'[') or raw.startswith(codecs.BOM_UTF8):
+        if HAS_ORJSON:
+            try:
+                return orjson.loads(raw), raw
+            except orjson.JSONDecodeError:
+                pass  # json also accepts a BOM, NaN and very large integers
+        try:
+            return json.loads(raw), raw
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError on bad UTF-8
+            pass
+    
+    # Decode only for repair, normalizing line endings as text mode would
+    content = raw.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+    
+    # A JSON5 parser handles comments and trailing commas in one C pass
+    if HAS_PYJSON5:
+        try:
+            return pyjson5.loads(content), raw
+        except pyjson5.Json5Exception:
+            pass  # Fall back to the regex repair
+    
+    # A complete object or array followed by junk only needs cutting short
+    start = len(content) - len(content.lstrip())
+    if content[start:start + 1] in ('{', '['):
+        try:
+            data, end = _DECODER.raw_decode(content, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if content[end:].strip():
+                line = content.count('\n', 0, end) + 1
+                report(f"  Ignored content after the JSON value on line {line}")
+            return data, raw
     
     # Try fixing common issues
     fixed_content = fix_vst3_json(content)
     
     try:
-        return json.loads(fixed_content)
+        return json.loads(fixed_content), raw
     except json.JSONDecodeError as e:
         # Show the specific issue for debugging
         lines = fixed_content.split('\n')
         if e.lineno and e.lineno <= len(lines):
-            print(f"  Problem at line {e.lineno}: {lines[e.lineno-1][:80]}")
-            print(f"  Error: {e.msg}")
-        return None
+            report(f"  Problem at line {e.lineno}: {lines[e.lineno-1][:80]}")
+            report(f"  Error: {e.msg}")
+        return None, raw
+
+
+def _find_moduleinfo(plugin_path: Union[str, Path]) -> Optional[Path]:
+    """
+    Find a plugin's moduleinfo.json, preferring Contents/Resources
+    
+    Args:
+        plugin_path: Path to the .vst3 bundle
+        
+    Returns:
+        Path to the moduleinfo.json file, or None if there isn't one
+    """
+    for subpath in _MODULEINFO_SUBPATHS:
+        path = os.path.join(plugin_path, subpath)
+        if os.path.exists(path):
+            return Path(path)
+    return None
 
 
 def test_specific_plugin(plugin_path: Path):
     """Test a specific VST3 plugin"""
-    print(f"\nTesting: {plugin_path.name}")
-    print("-" * 40)
-    
+    # Build the whole report first and write it in one call
+    lines = [f"\nTesting: {plugin_path.name}", "-" * 40]
+    parsed = _test_specific_plugin(plugin_path, lines.append)
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return parsed
+
+
+def _test_specific_plugin(plugin_path: Path, report: Callable[[str], Any]) -> bool:
+    """Test a specific VST3 plugin, passing each output line to report"""
     if not plugin_path.exists():
-        print(f"  ✗ Plugin not found")
+        report(f"  ✗ Plugin not found")
         return False
     
     # Look for moduleinfo.json
-    moduleinfo_paths = [
-        plugin_path / "Contents" / "Resources" / "moduleinfo.json",
-        plugin_path / "Contents" / "moduleinfo.json"
-    ]
-    
-    moduleinfo_found = False
-    parse_success = False
+    moduleinfo_path = _find_moduleinfo(plugin_path)
     
-    for moduleinfo_path in moduleinfo_paths:
-        if moduleinfo_path.exists():
-            moduleinfo_found = True
-            print(f"  ℹ Found moduleinfo.json at: {moduleinfo_path.relative_to(plugin_path)}")
-            
-            # Try our custom parser
-            data = parse_vst3_json(moduleinfo_path)
-            
-            if data:
-                parse_success = True
-                print(f"  ✓ Successfully parsed JSON")
-                
-                # Extract key information
-                name = data.get("Name", "Unknown")
-                version = data.get("Version", "Unknown")
-                
-                # Handle nested vendor info
-                vendor = "Unknown"
-                if "Factory Info" in data and isinstance(data["Factory Info"], dict):
-                    vendor = data["Factory Info"].get("Vendor", vendor)
-                elif "Vendor" in data:
-                    vendor = data["Vendor"]
-                
-                print(f"    Name: {name}")
-                print(f"    Version: {version}")
-                print(f"    Vendor: {vendor}")
-                
-                # Check for classes
-                if "Classes" in data and isinstance(data["Classes"], list):
-                    print(f"    Classes: {len(data['Classes'])} defined")
-            else:
-                print(f"  ✗ Failed to parse JSON")
-                
-                # Try to show a sample of the problematic content
-                try:
-                    with open(moduleinfo_path, 'r', encoding='utf-8', errors='replace') as f:
-                        content = f.read()
-                        # Show first few lines
-                        lines = content.split('\n')[:10]
-                        print("  First 10 lines of file:")
-                        for i, line in enumerate(lines, 1):
-                            print(f"    {i:2}: {line[:70]}")
-                except:
-                    pass
-            break
-    
-    if not moduleinfo_found:
-        print(f"  ℹ No moduleinfo.json found")
+    if moduleinfo_path is None:
+        report(f"  ℹ No moduleinfo.json found")
         return True  # Not an error, some VST3s don't have it
     
-    return parse_success
+    report(f"  ℹ Found moduleinfo.json at: {moduleinfo_path.relative_to(plugin_path)}")
+    
+    # Try our custom parser
+    data, raw = parse_vst3_json(moduleinfo_path, report=report)
+    
+    if data:
+        report(f"  ✓ Successfully parsed JSON")
+        
+        # Extract key information
+        name = data.get("Name", "Unknown")
+        version = data.get("Version", "Unknown")
+        
+        # Handle nested vendor info
+        vendor = "Unknown"
+        if "Factory Info" in data and isinstance(data["Factory Info"], dict):
+            vendor = data["Factory Info"].get("Vendor", vendor)
+        elif "Vendor" in data:
+            vendor = data["Vendor"]
+        
+        report(f"    Name: {name}")
+        report(f"    Version: {version}")
+        report(f"    Vendor: {vendor}")
+        
+        # Check for classes
+        if "Classes" in data and isinstance(data["Classes"], list):
+            report(f"    Classes: {len(data['Classes'])} defined")
+    else:
+        report(f"  ✗ Failed to parse JSON")
+        
+        # Show a sample of the problematic content, already read by the parser
+        if raw is not None:
+            content = raw.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+            # Show first few lines, splitting no further than needed
+            lines = content.split('\n', 10)[:10]
+            report("  First 10 lines of file:")
+            for i, line in enumerate(lines, 1):
+                report(f"    {i:2}: {line[:70]}")
+    
+    return bool(data)
 
 
-def scan_vst3_plugins():
-    """Scan all VST3 plugins and test JSON parsing"""
+def _scan_one(vst3_file: str, cache: MetadataCache) -> Tuple[bool, bool, List[str]]:
+    """
+    Find and parse the moduleinfo.json of one VST3 plugin
+    
+    Returns:
+        Whether the plugin has a moduleinfo.json, whether it parsed, and the
+        diagnostic messages to print
+    """
+    messages = []
+    
+    # Check for moduleinfo.json
+    path = _find_moduleinfo(vst3_file)
+    if path is None:
+        return False, False, messages
+    
+    # Try to parse it
+    data, _ = parse_vst3_json(path, cache, messages.append)
+    return True, bool(data), messages
+
+
+def scan_vst3_plugins(use_cache: bool = False):
+    """
+    Scan all VST3 plugins and test JSON parsing
+    
+    Args:
+        use_cache: Whether to reuse results from earlier runs for files that
+            haven't changed. Off by default so every file is checked against
+            the current parser.
+    """
     
     print("=" * 60)
     print("VST3 moduleinfo.json Parser Test")
     print("=" * 60)
     
-    # VST3 plugin directories
-    vst3_dirs = [
-        Path("/Library/Audio/Plug-Ins/VST3"),
-        Path.home() / "Library/Audio/Plug-Ins/VST3"
-    ]
-    
     # Problematic plugins from the error messages
     problematic_plugins = [
         "Bark of Dog 3.vst3",
@@ -205,7 +341,7 @@ def scan_vst3_plugins():
     problematic_found = 0
     problematic_success = 0
     
-    for vst3_dir in vst3_dirs:
+    for vst3_dir in _VST3_DIRS:
         if not vst3_dir.exists():
             continue
             
@@ -226,42 +362,47 @@ def scan_vst3_plugins():
     total_parsed = 0
     failed_plugins = []
     
-    for vst3_dir in vst3_dirs:
-        if not vst3_dir.exists():
-            print(f"\n✗ Directory not found: {vst3_dir}")
-            continue
-        
-        print(f"\n✓ Scanning: {vst3_dir}")
-        vst3_files = list(vst3_dir.glob("*.vst3"))
-        
-        if not vst3_files:
-            print("  No VST3 plugins found")
-            continue
-        
-        print(f"  Found {len(vst3_files)} VST3 plugin(s)")
-        
-        for vst3_file in vst3_files:
-            total_vst3 += 1
+    # With the cache, unchanged files are not re-parsed on later runs
+    cache = MetadataCache('vst3_moduleinfo')
+    if use_cache:
+        cache.open()
+    try:
+        for vst3_dir in _VST3_DIRS:
+            if not vst3_dir.exists():
+                print(f"\n✗ Directory not found: {vst3_dir}")
+                continue
+            
+            print(f"\n✓ Scanning: {vst3_dir}")
+            with os.scandir(vst3_dir) as entries:
+                vst3_files = [entry.path for entry in entries if entry.name.endswith(".vst3")]
+            
+            if not vst3_files:
+                print("  No VST3 plugins found")
+                continue
             
-            # Check for moduleinfo.json
-            moduleinfo_paths = [
-                vst3_file / "Contents" / "Resources" / "moduleinfo.json",
-                vst3_file / "Contents" / "moduleinfo.json"
-            ]
+            print(f"  Found {len(vst3_files)} VST3 plugin(s)")
             
-            has_json = False
-            for path in moduleinfo_paths:
-                if path.exists():
-                    has_json = True
+            # Parse in parallel; messages are written afterwards in plugin order
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda f: _scan_one(f, cache), vst3_files))
+            
+            output = []
+            for vst3_file, (has_json, parsed, messages) in zip(vst3_files, results):
+                total_vst3 += 1
+                output.extend(messages)
+                
+                if has_json:
                     total_with_json += 1
-                    
-                    # Try to parse it
-                    data = parse_vst3_json(path)
-                    if data:
+                    if parsed:
                         total_parsed += 1
                     else:
-                        failed_plugins.append(vst3_file.name)
-                    break
+                        failed_plugins.append(os.path.basename(vst3_file))
+            
+            # Write the messages for the whole directory in one call
+            if output:
+                sys.stdout.write('\n'.join(output) + '\n')
+    finally:
+        cache.close()
     
     # Summary
     print("\n" + "=" * 60)
@@ -308,6 +449,11 @@ def main():
         '--plugin',
         help='Test a specific plugin by name or path'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse results from earlier runs for unchanged files'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -321,9 +467,8 @@ def main():
         plugin_path = Path(args.plugin)
         if not plugin_path.exists():
             # Try to find it in standard locations
-            for base_dir in ["/Library/Audio/Plug-Ins/VST3", 
-                           str(Path.home() / "Library/Audio/Plug-Ins/VST3")]:
-                test_path = Path(base_dir) / args.plugin
+            for base_dir in _VST3_DIRS:
+                test_path = base_dir / args.plugin
                 if test_path.exists():
                     plugin_path = test_path
                     break
@@ -336,7 +481,7 @@ def main():
             sys.exit(1)
     else:
         # Run full scan
-        parsed, failed = scan_vst3_plugins()
+        parsed, failed = scan_vst3_plugins(args.cache)
         
         # Also test with the main scanner
         print("\n" + "=" * 60)